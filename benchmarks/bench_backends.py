@@ -0,0 +1,42 @@
+"""
+Benchmarks comparing the metadata backends by walking the same tree.
+
+With the package installed, run: python benchmarks/bench_backends.py [root]
+"""
+
+import sys
+import time
+from typing import List
+
+from unix_perms import MetadataBackend, ScandirBackend, StatxBackend
+
+REPEAT = 5
+
+
+def _files_per_second(backend: MetadataBackend, root: str) -> float:
+    best: float = 0.0
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        entries = sum(1 for _ in backend.walk(root=root))
+        elapsed = time.perf_counter() - started
+        best = max(best, entries / elapsed if elapsed else 0.0)
+    return best
+
+
+def main() -> None:
+    root = sys.argv[1] if len(sys.argv) > 1 else "/usr"
+
+    backends: List[MetadataBackend] = [ScandirBackend()]
+    if StatxBackend.is_available():
+        backends.append(StatxBackend())
+
+    # Warm the dentry and inode caches so every backend walks a hot tree
+    sum(1 for _ in ScandirBackend().walk(root=root))
+
+    for backend in backends:
+        rate = _files_per_second(backend=backend, root=root)
+        print(f"{backend.name:<10} {rate:>12,.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
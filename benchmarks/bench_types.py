@@ -0,0 +1,66 @@
+"""
+Benchmarks for constructing PermissionsByte and PermissionsMode objects.
+
+With the package installed, run: python benchmarks/bench_types.py
+"""
+
+import timeit
+from typing import Callable, Dict
+
+from unix_perms import PermissionsByte, PermissionsConfig, PermissionsMode
+
+NUMBER = 20_000
+
+ALL_PERMISSIONS_CONFIG = PermissionsConfig(read=True, write=True, execute=True)
+READ_PERMISSIONS_CONFIG = PermissionsConfig(read=True, write=False, execute=False)
+
+OWNER_BYTE = PermissionsByte(authority="owner", config=ALL_PERMISSIONS_CONFIG)
+GROUP_BYTE = PermissionsByte(authority="group", config=READ_PERMISSIONS_CONFIG)
+OTHERS_BYTE = PermissionsByte(authority="others", config=READ_PERMISSIONS_CONFIG)
+PERMISSIONS_MODE = PermissionsMode(
+    owner=OWNER_BYTE, group=GROUP_BYTE, others=OTHERS_BYTE
+)
+
+
+def _construct_byte() -> None:
+    PermissionsByte(authority="group", config=ALL_PERMISSIONS_CONFIG)
+
+
+def _byte_permissions_mode() -> None:
+    _ = OWNER_BYTE.permissions_mode
+
+
+def _construct_mode() -> None:
+    PermissionsMode(owner=OWNER_BYTE, group=GROUP_BYTE, others=OTHERS_BYTE)
+
+
+def _mode_permissions_mode() -> None:
+    _ = PERMISSIONS_MODE.permissions_mode
+
+
+def _mode_from_octal_representation() -> None:
+    PermissionsMode.from_octal_representation(octal=0o754)
+
+
+def _mode_add_byte() -> None:
+    _ = PERMISSIONS_MODE + OTHERS_BYTE
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "PermissionsByte()": _construct_byte,
+    "PermissionsByte.permissions_mode": _byte_permissions_mode,
+    "PermissionsMode()": _construct_mode,
+    "PermissionsMode.permissions_mode": _mode_permissions_mode,
+    "PermissionsMode.from_octal_representation": _mode_from_octal_representation,
+    "PermissionsMode + PermissionsByte": _mode_add_byte,
+}
+
+
+def main() -> None:
+    for name, benchmark in BENCHMARKS.items():
+        seconds: float = min(timeit.repeat(benchmark, number=NUMBER, repeat=5))
+        print(f"{name:<45} {seconds / NUMBER * 1e9:>10.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import io
+import stat
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from unix_perms import (
+    FileMetadata,
+    PermissionsMode,
+    inspect_archive,
+    iter_archive_members,
+    rewrite_archive_modes,
+)
+
+
+def _make_tar(path: Path) -> None:
+    """Creates a small tar archive with known permissions modes."""
+    with tarfile.open(path, mode="w:gz") as archive:
+        for name, member_type, mode in [
+            ("pkg", tarfile.DIRTYPE, 0o755),
+            ("pkg/tool", tarfile.REGTYPE, 0o4755),
+            ("pkg/data", tarfile.REGTYPE, 0o666),
+            ("pkg/link", tarfile.SYMTYPE, 0o777),
+        ]:
+            member = tarfile.TarInfo(name)
+            member.type = member_type
+            member.mode = mode
+            member.uid = 1000
+            member.gid = 1000
+            data = b"content" if member_type == tarfile.REGTYPE else b""
+            member.size = len(data)
+            if member_type == tarfile.SYMTYPE:
+                member.linkname = "data"
+            archive.addfile(member, io.BytesIO(data))
+
+
+def _make_zip(path: Path) -> None:
+    """Creates a small zip archive with Unix and MS-DOS attributes."""
+    with zipfile.ZipFile(path, mode="w") as archive:
+        directory = zipfile.ZipInfo("pkg/")
+        directory.create_system = 3
+        directory.external_attr = (stat.S_IFDIR | 0o755) << 16
+        archive.writestr(directory, b"")
+
+        script = zipfile.ZipInfo("pkg/script.py")
+        script.create_system = 3
+        script.external_attr = (stat.S_IFREG | 0o777) << 16
+        archive.writestr(script, b"print()")
+
+        dos_file = zipfile.ZipInfo("pkg/README")
+        dos_file.create_system = 0
+        dos_file.external_attr = 0x01
+        archive.writestr(dos_file, b"readme")
+
+
+def test_inspect_tar_archive(tmp_path: Path) -> None:
+    """
+    Testing inspection of a tar archive, which streams members and reports
+    the distribution of modes and policy violations.
+    """
+    path = tmp_path / "release.tar.gz"
+    _make_tar(path=path)
+
+    members = list(iter_archive_members(str(path)))
+    assert [member.file_type for member in members] == [
+        "directory",
+        "file",
+        "file",
+        "symlink",
+    ]
+    assert members[1].uid == 1000
+    assert members[1].mode == 0o4755
+
+    report = inspect_archive(str(path))
+    assert report.members == 4
+    assert report.distribution == {"666": 1, "755": 2}
+    assert report.violations == [
+        ("pkg/tool", "setuid bit is set"),
+        ("pkg/data", "world-writable"),
+    ]
+    assert inspect_archive(str(path), policy=None).violations == []
+
+
+def test_inspect_zip_archive(tmp_path: Path) -> None:
+    """
+    Testing inspection of a zip archive, which decodes modes from the
+    external attributes of members.
+    """
+    path = tmp_path / "package.whl"
+    _make_zip(path=path)
+
+    members = list(iter_archive_members(str(path)))
+    assert [(member.file_type, member.mode) for member in members] == [
+        ("directory", 0o755),
+        ("file", 0o777),
+        ("file", 0o444),
+    ]
+    assert members[0].uid == -1
+
+    report = inspect_archive(str(path))
+    assert report.distribution == {"444": 1, "755": 1, "777": 1}
+    assert report.violations == [("pkg/script.py", "world-writable")]
+
+    not_an_archive = tmp_path / "plain.txt"
+    not_an_archive.write_text("text")
+    with pytest.raises(ValueError):
+        _ = inspect_archive(str(not_an_archive))
+
+
+def test_rewrite_archive_modes(tmp_path: Path) -> None:
+    """
+    Testing rewriting the modes of archive members into a new archive.
+    """
+    tar_path = tmp_path / "release.tar.gz"
+    _make_tar(path=tar_path)
+    rewritten_tar = tmp_path / "normalized.tar.gz"
+
+    changed = rewrite_archive_modes(
+        str(tar_path),
+        str(rewritten_tar),
+        modes={
+            "file": "644",
+            "directory": PermissionsMode.from_octal_representation(0o750),
+        },
+    )
+    assert changed == 3
+    assert inspect_archive(str(rewritten_tar)).distribution == {"644": 2, "750": 1}
+    with tarfile.open(rewritten_tar) as archive:
+        data = archive.extractfile("pkg/data")
+        assert data is not None and data.read() == b"content"
+        assert archive.getmember("pkg/link").linkname == "data"
+
+    zip_path = tmp_path / "package.whl"
+    _make_zip(path=zip_path)
+    rewritten_zip = tmp_path / "normalized.whl"
+
+    def rewriter(member: FileMetadata) -> Optional[int]:
+        return 0o755 if member.path.endswith(".py") else None
+
+    changed = rewrite_archive_modes(str(zip_path), str(rewritten_zip), rewriter)
+    assert changed == 1
+    assert inspect_archive(str(rewritten_zip)).distribution == {"444": 1, "755": 2}
+    with zipfile.ZipFile(rewritten_zip) as archive:
+        assert archive.read("pkg/script.py") == b"print()"
+
+
+def test_rewrite_archive_modes_same_file(tmp_path: Path) -> None:
+    """
+    Testing that rewriting an archive onto itself is rejected and leaves the
+    archive intact.
+    """
+    tar_path = tmp_path / "release.tar.gz"
+    _make_tar(path=tar_path)
+    original = tar_path.read_bytes()
+
+    for destination in [str(tar_path), str(tmp_path / "." / "release.tar.gz")]:
+        with pytest.raises(ValueError) as exc_info:
+            _ = rewrite_archive_modes(str(tar_path), destination, {"file": 0o644})
+        assert (
+            str(exc_info.value)
+            == "Destination must be a different file than the source"
+        )
+
+    assert tar_path.read_bytes() == original
+
+
+def test_rewrite_archive_modes_unknown_file_type(tmp_path: Path) -> None:
+    """
+    Testing that mappings with keys that are not file types are rejected
+    instead of silently rewriting nothing.
+    """
+    tar_path = tmp_path / "release.tar.gz"
+    _make_tar(path=tar_path)
+
+    for modes in [{"files": 0o644}, {"file": 0o644, "dir": 0o755}]:
+        with pytest.raises(ValueError) as exc_info:
+            _ = rewrite_archive_modes(
+                str(tar_path), str(tmp_path / "out.tar.gz"), modes
+            )
+        assert str(exc_info.value).startswith("File type should be one of ('file'")
+
+    assert not (tmp_path / "out.tar.gz").exists()
+    assert (
+        rewrite_archive_modes(
+            str(tar_path), str(tmp_path / "out.tar.gz"), {"fifo": 0o600}
+        )
+        == 0
+    )
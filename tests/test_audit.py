@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from unix_perms import InotifyWatcher, ModeAudit
+
+pytestmark = pytest.mark.skipif(
+    os.name != "posix", reason="Unix permissions modes require a POSIX platform"
+)
+
+
+def _make_tree(root: Path) -> None:
+    """Creates a small tree with known permissions modes."""
+    (root / "bin").mkdir(mode=0o755)
+    (root / "private").mkdir(mode=0o700)
+    for path, mode in [
+        (root / "bin" / "tool", 0o755),
+        (root / "private" / "key", 0o600),
+        (root / "README", 0o644),
+    ]:
+        path.write_text("data")
+        path.chmod(mode)
+    root.chmod(0o755)
+    (root / "bin").chmod(0o755)
+    (root / "private").chmod(0o700)
+
+
+def _wait_for_ctime_change(directory: Path, ctime_ns: int) -> None:
+    """
+    Waits until the ctime of a directory differs from a previous value, since
+    filesystems without fine-grained timestamps only advance it once per
+    clock tick, by repeatedly adding and removing an entry.
+    """
+    marker = directory / ".ctime"
+    while os.stat(directory).st_ctime_ns == ctime_ns:
+        time.sleep(0.001)
+        marker.touch()
+        marker.unlink()
+
+
+def test_mode_audit_scan_and_update(tmp_path: Path) -> None:
+    """
+    Testing the ModeAudit class which incrementally audits the distribution
+    of permissions modes across a tree.
+    """
+    _make_tree(root=tmp_path)
+
+    # Without a racy margin, directories unchanged since the previous run are
+    # never rescanned, even when the tree was modified moments before
+    audit = ModeAudit(root=str(tmp_path), racy_margin_ns=0)
+    summary = audit.scan()
+
+    assert summary.directories_checked == 3
+    assert summary.directories_rescanned == 3
+    assert audit.distribution == {"600": 1, "644": 1, "700": 1, "755": 3}
+    assert audit.total == 6
+
+    summary = audit.update()
+    assert summary.directories_checked == 3
+    assert summary.directories_rescanned == 0
+
+    ctime_ns = os.stat(tmp_path / "private").st_ctime_ns
+    (tmp_path / "private" / "key").unlink()
+    (tmp_path / "private" / "token").write_text("data")
+    (tmp_path / "private" / "token").chmod(0o400)
+    _wait_for_ctime_change(directory=tmp_path / "private", ctime_ns=ctime_ns)
+    summary = audit.update()
+    assert summary.directories_rescanned == 1
+    assert audit.distribution == {"400": 1, "644": 1, "700": 1, "755": 3}
+
+    # A file mode change does not affect its directory's ctime
+    (tmp_path / "README").chmod(0o666)
+    assert audit.update().directories_rescanned == 0
+    audit.update(verify_files=True)
+    assert audit.distribution == {"400": 1, "666": 1, "700": 1, "755": 3}
+
+    (tmp_path / "bin" / "tool").chmod(0o700)
+    audit.update(changed_directories=[str(tmp_path / "bin")])
+    assert audit.distribution == {"400": 1, "666": 1, "700": 2, "755": 2}
+
+    # With the default margin, directories changed around the previous run
+    # are rescanned, in case they changed again within the same clock tick
+    racy_audit = ModeAudit(root=str(tmp_path))
+    racy_audit.scan()
+    assert racy_audit.update().directories_rescanned == 3
+
+    for path in (tmp_path / "private").iterdir():
+        path.unlink()
+    (tmp_path / "private").rmdir()
+    audit.update()
+    assert audit.distribution == {"666": 1, "700": 1, "755": 2}
+
+
+def test_mode_audit_save_and_load(tmp_path: Path) -> None:
+    """
+    Testing persistence of the ModeAudit state to a JSON state file.
+    """
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(root=tree)
+
+    audit = ModeAudit(root=str(tree))
+    audit.scan()
+
+    state_file = str(tmp_path / "state.json")
+    audit.save(state_file)
+    loaded = ModeAudit.load(state_file, racy_margin_ns=0)
+
+    assert loaded.root == audit.root
+    assert loaded.racy_margin_ns == 0
+    assert loaded.distribution == audit.distribution
+    summary = loaded.update()
+    assert summary.directories_checked == 3
+    assert summary.directories_rescanned == 0
+
+    Path(state_file).write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        _ = ModeAudit.load(state_file)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_inotify_watcher(tmp_path: Path) -> None:
+    """
+    Testing the InotifyWatcher class which records changed directories
+    for incremental audits.
+    """
+    _make_tree(root=tmp_path)
+
+    with InotifyWatcher(root=str(tmp_path)) as watcher:
+        assert watcher.read_changed_directories() == set()
+
+        (tmp_path / "bin" / "tool").chmod(0o700)
+        (tmp_path / "new").mkdir()
+        changed = watcher.read_changed_directories()
+        assert changed == {
+            str(tmp_path),
+            str(tmp_path / "bin"),
+            str(tmp_path / "new"),
+        }
+
+        (tmp_path / "new" / "file").write_text("data")
+        assert watcher.read_changed_directories() == {str(tmp_path / "new")}
@@ -0,0 +1,110 @@
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from unix_perms import (
+    DirectoryTree,
+    FileMetadata,
+    MetadataBackend,
+    PermissionsIndex,
+    PermissionsQuery,
+    ScandirBackend,
+    StatxBackend,
+    get_metadata_backend,
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="requires Unix permissions")
+
+
+def _make_tree(root: Path) -> None:
+    """
+    Creates a small tree with files, directories and a symbolic link.
+    """
+    (root / "app" / "bin").mkdir(parents=True)
+    (root / "app" / "bin" / "run").write_text("run")
+    (root / "app" / "config").write_text("config")
+    (root / "app" / "link").symlink_to(root / "app" / "bin")
+    os.chmod(root / "app" / "bin" / "run", 0o4755)
+    os.chmod(root / "app" / "config", 0o640)
+
+
+def test_metadata_backends_agree(tmp_path: Path) -> None:
+    """
+    Testing that every available metadata backend walks a tree to the same
+    entries, without following symbolic links.
+    """
+    _make_tree(root=tmp_path)
+    backends: List[MetadataBackend] = [ScandirBackend()]
+    if StatxBackend.is_available():
+        backends.append(StatxBackend())
+
+    results = []
+    for backend in backends:
+        entries = sorted(
+            backend.walk(str(tmp_path), include_root=True), key=lambda m: m.path
+        )
+        results.append(entries)
+
+        paths = [os.path.relpath(entry.path, tmp_path) for entry in entries]
+        assert paths == [".", "app", "app/bin", "app/bin/run", "app/config", "app/link"]
+        assert entries[3].mode == 0o4755
+        assert entries[4].mode == 0o640
+        assert entries[5].file_type == "symlink"
+        assert entries[0] == backend.metadata(str(tmp_path))
+
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.skipif(not StatxBackend.is_available(), reason="requires statx")
+def test_statx_backend(tmp_path: Path) -> None:
+    """
+    Testing the StatxBackend class against os.lstat.
+    """
+    _make_tree(root=tmp_path)
+    backend = get_metadata_backend("statx")
+    assert isinstance(backend, StatxBackend)
+
+    path = str(tmp_path / "app" / "config")
+    metadata = backend.metadata(path)
+    path_stat = os.lstat(path)
+    assert (metadata.mode, metadata.uid, metadata.gid) == (
+        0o640,
+        path_stat.st_uid,
+        path_stat.st_gid,
+    )
+
+    with pytest.raises(FileNotFoundError):
+        _ = backend.metadata(str(tmp_path / "missing"))
+
+    assert list(backend.walk(str(tmp_path / "missing"))) == []
+
+
+def test_backends_plug_into_scanners(tmp_path: Path) -> None:
+    """
+    Testing that scanners accept a metadata backend and that unknown backend
+    names are rejected.
+    """
+    _make_tree(root=tmp_path)
+    backend = get_metadata_backend()
+    assert isinstance(backend, ScandirBackend)
+
+    index = PermissionsIndex.from_tree(str(tmp_path), backend=backend)
+    assert index.count(PermissionsQuery.special("setuid")) == 1
+
+    tree = DirectoryTree.from_tree(str(tmp_path), backend=backend)
+    assert len(tree) == 6
+
+    class IncompleteBackend(MetadataBackend):
+        name = "incomplete"
+
+        def metadata(self, path: str) -> FileMetadata:
+            return FileMetadata.from_path(path=path)
+
+    with pytest.raises(TypeError):
+        _ = IncompleteBackend()  # type: ignore[abstract]
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = get_metadata_backend("getdents")
+    assert str(exc_info.value) == "Backend should be one of ('scandir', 'statx')"
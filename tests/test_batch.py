@@ -0,0 +1,82 @@
+from array import array
+
+from unix_perms import (
+    MODE_INVALID_FORMAT,
+    MODE_INVALID_TYPE,
+    MODE_OK,
+    MODE_OUT_OF_RANGE,
+    PermissionsMode,
+    normalize_modes,
+)
+
+
+def test_normalize_modes_mixed_inputs() -> None:
+    """
+    Testing the normalize_modes function which normalizes a batch of mixed
+    octal representations in bulk.
+    """
+    values = [
+        "0o755",
+        "755",
+        493,
+        b"0755",
+        "0755",
+        bytearray(b" 0o644 "),
+        PermissionsMode.from_octal_representation("600"),
+        "0",
+        "000",
+    ]
+    result = normalize_modes(values)
+
+    assert isinstance(result.modes, array)
+    assert result.modes.typecode == "H"
+    assert result.errors.typecode == "B"
+    assert list(result.modes) == [0o755] * 5 + [0o644, 0o600, 0, 0]
+    assert set(result.errors) == {MODE_OK}
+
+
+def test_normalize_modes_errors() -> None:
+    """
+    Testing that normalize_modes reports a per-item error code instead of
+    raising on bad values.
+    """
+    values = ["755", "999", "1755", 512, -1, "0o", "", "0x1ed", 7.0, True, None]
+    result = normalize_modes(values)
+
+    assert list(result.errors) == [
+        MODE_OK,
+        MODE_INVALID_FORMAT,
+        MODE_OUT_OF_RANGE,
+        MODE_OUT_OF_RANGE,
+        MODE_OUT_OF_RANGE,
+        MODE_INVALID_FORMAT,
+        MODE_INVALID_FORMAT,
+        MODE_INVALID_FORMAT,
+        MODE_INVALID_TYPE,
+        MODE_INVALID_TYPE,
+        MODE_INVALID_TYPE,
+    ]
+    assert list(result.modes) == [0o755] + [0] * 10
+
+
+def test_normalize_modes_buffers() -> None:
+    """
+    Testing that normalize_modes splits text buffers on whitespace and commas
+    and accepts any iterable, including typed arrays.
+    """
+    result = normalize_modes(b"0755, 644\n0o600 9")
+    assert list(result.modes) == [0o755, 0o644, 0o600, 0]
+    assert list(result.errors) == [MODE_OK, MODE_OK, MODE_OK, MODE_INVALID_FORMAT]
+
+    result = normalize_modes(memoryview(b"700 070"))
+    assert list(result.modes) == [0o700, 0o070]
+
+    result = normalize_modes("755,644")
+    assert list(result.modes) == [0o755, 0o644]
+
+    result = normalize_modes(array("H", [0o755, 0o1000]))
+    assert list(result.modes) == [0o755, 0]
+    assert list(result.errors) == [MODE_OK, MODE_OUT_OF_RANGE]
+
+    result = normalize_modes(iter([]))
+    assert len(result.modes) == 0 and len(result.errors) == 0
@@ -0,0 +1,114 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from unix_perms import (
+    DirectoryTree,
+    FileMetadata,
+    apply_capital_x,
+    check_directory_mode,
+    is_traversable,
+)
+
+ENTRIES = [
+    FileMetadata("/srv", 0o755, 0, 0, "directory"),
+    FileMetadata("/srv/shared", 0o2770, 0, 100, "directory"),
+    FileMetadata("/srv/shared/team", 0o2750, 0, 100, "directory"),
+    FileMetadata("/srv/shared/other", 0o770, 0, 100, "directory"),
+    FileMetadata("/srv/shared/foreign", 0o2770, 0, 200, "directory"),
+    FileMetadata("/srv/shared/team/notes", 0o640, 0, 100, "file"),
+    FileMetadata("/srv/listing", 0o744, 0, 0, "directory"),
+    FileMetadata("/srv/listing/data", 0o644, 0, 0, "file"),
+]
+
+
+def test_apply_capital_x() -> None:
+    """
+    Testing the apply_capital_x function which grants execute permission to
+    directories and already executable files only.
+    """
+    assert apply_capital_x(0o644, "directory") == 0o755
+    assert apply_capital_x(0o644, "file") == 0o644
+    assert apply_capital_x(0o744, "file") == 0o755
+    assert apply_capital_x(0o4700, "file", ["group"]) == 0o4710
+    assert apply_capital_x(0o600, "directory", ["owner"]) == 0o700
+
+    with pytest.raises(ValueError):
+        _ = apply_capital_x(0o600, "directory", ["world"])  # type: ignore[list-item]
+
+
+def test_directory_mode_checks() -> None:
+    """
+    Testing the is_traversable and check_directory_mode functions for
+    directory semantics of the execute bit.
+    """
+    assert is_traversable(0o711, "others")
+    assert not is_traversable(0o744, "group")
+    assert check_directory_mode(0o755) == []
+    assert check_directory_mode(0o1777) == []
+    assert check_directory_mode(0o746) == [
+        "group can list but not traverse",
+        "others can list but not traverse",
+        "others can write but not traverse",
+    ]
+
+
+def test_directory_tree() -> None:
+    """
+    Testing the DirectoryTree class which computes traversability and
+    setgid inheritance over a tree in one pass.
+    """
+    tree = DirectoryTree(ENTRIES, umask=0o027)
+    assert len(tree) == 8
+
+    state = tree.state("/srv/shared/team")
+    assert state.traversable == ("owner", "group")
+    assert state.inherited_gid == 100
+    assert state.new_file_mode == 0o640
+    assert state.new_directory_mode == 0o2750
+
+    assert tree.state("/srv/listing").traversable == ("owner",)
+    assert tree.state("/srv/shared/other").inherited_gid is None
+    assert tree.reachable_by("/srv/listing/data") == ("owner",)
+    assert tree.reachable_by("/srv/shared/team/notes") == ("owner", "group")
+    assert tree.reachable_by("/srv/shared") == ("owner", "group", "others")
+
+    assert tree.new_entry("/srv/shared") == (100, 0o640)
+    assert tree.new_entry("/srv/shared", is_directory=True) == (100, 0o2750)
+    assert tree.new_entry("/srv") == (None, 0o640)
+
+    assert tree.issues() == [
+        ("/srv/listing", "group can list but not traverse"),
+        ("/srv/listing", "others can list but not traverse"),
+        ("/srv/shared/foreign", "group differs from setgid parent"),
+        ("/srv/shared/other", "setgid bit not inherited from parent"),
+    ]
+
+    with pytest.raises(KeyError):
+        _ = tree.state("/srv/listing/data")
+
+
+@pytest.mark.skipif(os.name != "posix", reason="requires Unix permissions")
+def test_directory_tree_from_tree(tmp_path: Path) -> None:
+    """
+    Testing the 'from_tree' constructor of DirectoryTree which scans the
+    root and every entry below it.
+    """
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "notes").write_text("notes")
+    os.chmod(shared, 0o2770)
+    os.chmod(tmp_path, 0o711)
+
+    try:
+        tree = DirectoryTree.from_tree(str(tmp_path))
+        gid = os.stat(shared).st_gid
+        assert os.stat(shared).st_mode & stat.S_ISGID
+        assert tree.state(str(tmp_path)).traversable == ("owner", "group", "others")
+        assert tree.state(str(shared)).traversable == ("owner", "group")
+        assert tree.new_entry(str(shared)).gid == gid
+        assert tree.reachable_by(str(shared / "notes")) == ("owner", "group")
+    finally:
+        os.chmod(tmp_path, 0o755)
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from unix_perms import FileMetadata, PermissionsIndex, PermissionsQuery
+
+ENTRIES = [
+    FileMetadata("/srv", 0o755, 0, 0, "directory"),
+    FileMetadata("/srv/app", 0o775, 0, 0, "directory"),
+    FileMetadata("/srv/app/run", 0o4755, 0, 0, "file"),
+    FileMetadata("/srv/app/data", 0o664, 0, 0, "file"),
+    FileMetadata("/srv/app/shared", 0o670, 0, 0, "file"),
+    FileMetadata("/srv-old/data", 0o666, 0, 0, "file"),
+    FileMetadata("/tmp", 0o1777, 0, 0, "directory"),
+]
+
+
+def test_permissions_index_queries() -> None:
+    """
+    Testing the PermissionsIndex class which answers boolean queries over
+    permission bits and path prefixes with bitmaps.
+    """
+    index = PermissionsIndex(ENTRIES)
+    assert len(index) == 7
+
+    query = (
+        PermissionsQuery.has("group", "write")
+        & PermissionsQuery.lacks("owner", "execute")
+        & PermissionsQuery.under("/srv")
+    )
+    assert list(index.query(query)) == ["/srv/app/data", "/srv/app/shared"]
+    assert index.count(query) == 2
+
+    assert list(index.query(PermissionsQuery.under("/srv/"))) == [
+        "/srv",
+        "/srv/app",
+        "/srv/app/data",
+        "/srv/app/run",
+        "/srv/app/shared",
+    ]
+    assert list(index.query(PermissionsQuery.special("setuid"))) == ["/srv/app/run"]
+    assert list(
+        index.query(PermissionsQuery.special("sticky") | PermissionsQuery.mode("666"))
+    ) == ["/srv-old/data", "/tmp"]
+    assert index.count(PermissionsQuery.of_type("directory")) == 3
+    assert index.count(~PermissionsQuery.of_type("directory")) == 4
+    assert index.count(PermissionsQuery.of_type("socket")) == 0
+    assert index.count(PermissionsQuery.under("/")) == 7
+
+    with pytest.raises(ValueError):
+        _ = PermissionsQuery.has("group", "delete")  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        _ = PermissionsQuery.has("world", "read")  # type: ignore[arg-type]
+
+
+def test_permissions_index_large() -> None:
+    """
+    Testing the PermissionsIndex class with enough entries to span several
+    64-bit words of each bitmap.
+    """
+    entries = [
+        FileMetadata(
+            f"/data/{number:05d}", 0o644 if number % 3 else 0o600, 0, 0, "file"
+        )
+        for number in range(1000)
+    ]
+    index = PermissionsIndex(entries)
+
+    private = list(index.query(PermissionsQuery.lacks("others", "read")))
+    assert len(private) == 334
+    assert private[:2] == ["/data/00000", "/data/00003"]
+    assert private[-1] == "/data/00999"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Requires a POSIX platform")
+def test_permissions_index_from_tree(tmp_path: Path) -> None:
+    """
+    Testing the 'from_tree' class method of PermissionsIndex which scans a
+    directory tree.
+    """
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin").chmod(0o755)
+    (tmp_path / "bin" / "tool").write_text("data")
+    (tmp_path / "bin" / "tool").chmod(0o755)
+
+    index = PermissionsIndex.from_tree(str(tmp_path))
+    assert list(index.query(PermissionsQuery.has("others", "execute"))) == [
+        str(tmp_path / "bin"),
+        str(tmp_path / "bin" / "tool"),
+    ]
@@ -0,0 +1,187 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from unix_perms import PermissionsManifest, PermissionsMode, converge, execute_plan
+
+pytestmark = pytest.mark.skipif(
+    os.name != "posix", reason="Unix permissions modes require a POSIX platform"
+)
+
+
+def _make_tree(root: Path) -> None:
+    """Creates a small deploy tree with known permissions modes."""
+    (root / "bin").mkdir()
+    (root / "config").mkdir()
+    for path, mode in [
+        (root / "bin" / "start.sh", 0o644),
+        (root / "bin" / "run.sh", 0o755),
+        (root / "config" / "app.conf", 0o666),
+        (root / "config" / "secret.key", 0o644),
+    ]:
+        path.write_text("data")
+        path.chmod(mode)
+    (root / "bin").chmod(0o755)
+    (root / "config").chmod(0o777)
+
+
+MANIFEST = {
+    "entries": [
+        {"pattern": "**", "mode": "644", "file_type": "file"},
+        {"pattern": "**", "mode": "public-dir", "file_type": "directory"},
+        {"pattern": "bin/*.sh", "mode": "0o755"},
+        {"pattern": "config/*.key", "mode": "600"},
+    ]
+}
+
+
+def test_permissions_manifest_match() -> None:
+    """
+    Testing the 'match' method of PermissionsManifest which finds the last
+    entry matching a path.
+    """
+    manifest = PermissionsManifest.model_validate(MANIFEST)
+
+    assert manifest.entries[1].mode == 0o755
+    assert manifest.entries[2].permissions.permissions_mode == "755"
+
+    entry = manifest.match("bin/start.sh")
+    assert entry is not None and entry.mode == 0o755
+
+    entry = manifest.match("config/secret.key")
+    assert entry is not None and entry.mode == 0o600
+
+    entry = manifest.match("config/nested/app.conf")
+    assert entry is not None and entry.mode == 0o644
+
+    entry = manifest.match("config", is_directory=True)
+    assert entry is not None and entry.mode == 0o755
+
+    assert PermissionsManifest().match("anything") is None
+
+    with pytest.raises(ValidationError):
+        _ = PermissionsManifest.model_validate(
+            {"entries": [{"pattern": "*", "mode": "999"}]}
+        )
+
+
+def test_converge(tmp_path: Path) -> None:
+    """
+    Testing the convergence of a tree to a manifest, which plans only the
+    needed changes and then executes them.
+    """
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _make_tree(root=tree)
+
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(MANIFEST))
+    manifest = PermissionsManifest.from_file(str(manifest_file))
+
+    plan, summary = converge(manifest, str(tree), dry_run=True)
+    assert summary is None
+    assert plan.entries_examined == 6
+    assert sorted(
+        (os.path.relpath(change.path, tree), change.target_mode)
+        for change in plan.changes
+    ) == [
+        ("bin/start.sh", 0o755),
+        ("config", 0o755),
+        ("config/app.conf", 0o644),
+        ("config/secret.key", 0o600),
+    ]
+    assert (tree / "config" / "app.conf").stat().st_mode & 0o777 == 0o666
+
+    summary = execute_plan(plan)
+    assert summary.changed == 4
+    assert summary.failed == 0
+    assert (tree / "config" / "secret.key").stat().st_mode & 0o777 == 0o600
+
+    plan, summary = converge(manifest, str(tree))
+    assert plan.changes == []
+    assert summary is not None and summary.changed == 0
+
+
+def test_permissions_manifest_from_yaml(tmp_path: Path) -> None:
+    """
+    Testing loading a PermissionsManifest from a YAML file.
+    """
+    _ = pytest.importorskip("yaml")
+
+    manifest_file = tmp_path / "manifest.yaml"
+    manifest_file.write_text(
+        "entries:\n"
+        "  - pattern: 'var/**'\n"
+        "    mode: private-dir\n"
+        "    file_type: directory\n"
+    )
+    manifest = PermissionsManifest.from_file(str(manifest_file))
+
+    entry = manifest.match("var/lib", is_directory=True)
+    assert entry is not None and entry.mode == 0o700
+    assert manifest.match("var/lib") is None
+
+
+def test_permissions_manifest_integer_modes(tmp_path: Path) -> None:
+    """
+    Testing that integer modes are rejected however the manifest is loaded,
+    so that 644 is never silently read as a decimal.
+    """
+    with pytest.raises(ValidationError):
+        _ = PermissionsManifest.model_validate(
+            {"entries": [{"pattern": "*", "mode": 444}]}
+        )
+
+    for mode in [True, 4.0, None]:
+        with pytest.raises(ValidationError):
+            _ = PermissionsManifest.model_validate(
+                {"entries": [{"pattern": "*", "mode": mode}]}
+            )
+
+    manifest = PermissionsManifest.model_validate(
+        {
+            "entries": [
+                {"pattern": "*", "mode": "444"},
+                {"pattern": "*.key", "mode": "0400"},
+                {
+                    "pattern": "*.sh",
+                    "mode": PermissionsMode.from_octal_representation(0o755),
+                },
+            ]
+        }
+    )
+    assert [entry.mode for entry in manifest.entries] == [0o444, 0o400, 0o755]
+
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text('{"entries": [{"pattern": "*.key", "mode": 400}]}')
+    with pytest.raises(ValidationError):
+        _ = PermissionsManifest.from_file(str(manifest_file))
+
+
+def test_permissions_manifest_integer_yaml_modes(tmp_path: Path) -> None:
+    """
+    Testing that unquoted YAML integers, including YAML 1.1 octal integers
+    with a leading zero, are rejected while quoted modes are accepted.
+    """
+    _ = pytest.importorskip("yaml")
+
+    manifest_file = tmp_path / "manifest.yaml"
+    for mode in ["400", "0644"]:
+        manifest_file.write_text(f"entries:\n  - pattern: '*'\n    mode: {mode}\n")
+        with pytest.raises(ValidationError):
+            _ = PermissionsManifest.from_file(str(manifest_file))
+
+    manifest_file.write_text(
+        "entries:\n"
+        "  - pattern: '*.key'\n"
+        "    mode: '400'\n"
+        "  - pattern: '*.conf'\n"
+        '    mode: "0644"\n'
+        "  - pattern: '*.sh'\n"
+        "    mode: 0o755\n"
+    )
+    manifest = PermissionsManifest.from_file(str(manifest_file))
+    assert [entry.mode for entry in manifest.entries] == [0o400, 0o644, 0o755]
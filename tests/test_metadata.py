@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from unix_perms import FileMetadata, OwnerResolver
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Requires a POSIX platform")
+def test_file_metadata(tmp_path: Path) -> None:
+    """
+    Testing the FileMetadata record which pairs a permissions mode with the
+    owner, group and file type of a file.
+    """
+    path = tmp_path / "tool"
+    path.write_text("data")
+    path.chmod(0o4750)
+
+    metadata = FileMetadata.from_path(str(path))
+    assert metadata.file_type == "file"
+    assert metadata.uid == os.getuid()
+    assert metadata.mode == 0o4750
+    assert metadata.permissions_mode == "750"
+    assert metadata.permissions.permissions_mode == "750"
+    assert metadata.is_setuid
+    assert not metadata.is_setgid
+    assert not metadata.is_sticky
+
+    directory = FileMetadata.from_path(str(tmp_path))
+    assert directory.file_type == "directory"
+    assert directory != metadata
+
+    with pytest.raises(AttributeError):
+        metadata.owner = "root"  # type: ignore[attr-defined]
+
+
+def test_owner_resolver(tmp_path: Path) -> None:
+    """
+    Testing the OwnerResolver class which resolves and caches user and
+    group names.
+    """
+    passwd_file = tmp_path / "passwd"
+    passwd_file.write_text(
+        "# comment\n"
+        "root:x:0:0:root:/root:/bin/bash\n"
+        "deploy:x:1500:1500::/home/deploy:/bin/sh\n"
+        "duplicate:x:1500:1500::/:/bin/sh\n"
+        "broken-line\n"
+    )
+    group_file = tmp_path / "group"
+    group_file.write_text("root:x:0:\ndeploy:x:1500:\n")
+
+    resolver = OwnerResolver(
+        maxsize=2, passwd_file=str(passwd_file), group_file=str(group_file)
+    )
+    assert resolver.user_name(1500) == "deploy"
+    assert resolver.group_name(0) == "root"
+
+    metadata = FileMetadata(
+        path="/srv/app", mode=0o755, uid=1500, gid=0, file_type="directory"
+    )
+    assert resolver.resolve(metadata) == ("deploy", "root")
+
+    # Ids missing from the preloaded databases fall back to cached lookups
+    for uid in (4_000_000_001, 4_000_000_002, 4_000_000_003):
+        assert resolver.user_name(uid) is None
+    assert len(resolver._user_cache) == 2
+
+    with pytest.raises(ValueError):
+        _ = OwnerResolver(maxsize=0)
@@ -0,0 +1,100 @@
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import List, Tuple
+
+from unix_perms import scan_oci_image
+
+
+def _write_blob(layout: Path, data: bytes) -> str:
+    """Writes a blob to an OCI image layout and returns its digest."""
+    encoded = hashlib.sha256(data).hexdigest()
+    (layout / "blobs" / "sha256" / encoded).write_bytes(data)
+    return f"sha256:{encoded}"
+
+
+def _make_layer(members: List[Tuple[str, bytes, int]]) -> bytes:
+    """Creates a gzip-compressed layer tarball in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as layer:
+        for name, member_type, mode in members:
+            member = tarfile.TarInfo(name)
+            member.type = member_type
+            member.mode = mode
+            layer.addfile(member, io.BytesIO(b""))
+    return buffer.getvalue()
+
+
+def _make_layout(layout: Path) -> None:
+    """Creates an OCI image layout with three stacked layers."""
+    (layout / "blobs" / "sha256").mkdir(parents=True)
+    (layout / "oci-layout").write_text('{"imageLayoutVersion": "1.0.0"}')
+
+    layers = [
+        [
+            ("./usr", tarfile.DIRTYPE, 0o755),
+            ("./usr/bin", tarfile.DIRTYPE, 0o755),
+            ("./usr/bin/su", tarfile.REGTYPE, 0o4755),
+            ("./usr/bin/ls", tarfile.REGTYPE, 0o755),
+            ("./tmp", tarfile.DIRTYPE, 0o1777),
+            ("./opt", tarfile.DIRTYPE, 0o755),
+            ("./opt/app", tarfile.DIRTYPE, 0o755),
+            ("./opt/app/old", tarfile.REGTYPE, 0o666),
+        ],
+        [
+            ("./usr/bin/.wh.su", tarfile.REGTYPE, 0o644),
+            ("./opt/app/.wh..wh..opq", tarfile.REGTYPE, 0o644),
+            ("./opt/app/new", tarfile.REGTYPE, 0o644),
+        ],
+        [
+            ("./usr/bin/ls", tarfile.REGTYPE, 0o777),
+            ("./srv", tarfile.REGTYPE, 0o644),
+        ],
+    ]
+    layer_descriptors = [
+        {
+            "mediaType": "application/vnd.oci.image.layer.v1.tar+gzip",
+            "digest": _write_blob(layout=layout, data=_make_layer(members)),
+        }
+        for members in layers
+    ]
+
+    manifest = json.dumps({"schemaVersion": 2, "layers": layer_descriptors})
+    manifest_digest = _write_blob(layout=layout, data=manifest.encode())
+    index = {
+        "schemaVersion": 2,
+        "manifests": [
+            {
+                "mediaType": "application/vnd.oci.image.manifest.v1+json",
+                "digest": manifest_digest,
+            }
+        ],
+    }
+    (layout / "index.json").write_text(json.dumps(index))
+
+
+def test_scan_oci_image(tmp_path: Path) -> None:
+    """
+    Testing the 'scan_oci_image' function which applies stacked layers with
+    overlay semantics and reports the effective mode of every path.
+    """
+    _make_layout(layout=tmp_path)
+
+    report = scan_oci_image(str(tmp_path), max_workers=2)
+    assert report.layers == 3
+    assert list(report.entries) == [
+        "opt",
+        "opt/app",
+        "opt/app/new",
+        "srv",
+        "tmp",
+        "usr",
+        "usr/bin",
+        "usr/bin/ls",
+    ]
+    assert report.entries["usr/bin/ls"].mode == 0o777
+    assert report.entries["tmp"].is_sticky
+    assert report.distribution == {"644": 2, "755": 4, "777": 2}
+    assert report.violations == [("usr/bin/ls", "world-writable")]
@@ -7,6 +7,7 @@ from unix_perms import (
     OctalPermissions,
     from_octal_digit_to_config,
     from_octal_to_permissions_mode,
+    get_permissions_mask,
     is_permissions_mode,
 )
 from unix_perms._octals import (
@@ -57,6 +58,8 @@ def test_from_octal_to_permissions_mode() -> None:
     assert from_octal_to_permissions_mode(octal=0o000) == "000"
     assert from_octal_to_permissions_mode(octal=0) == "000"
     assert from_octal_to_permissions_mode(octal=438) == "666"
+    assert from_octal_to_permissions_mode(octal="0o755") == "755"
+    assert from_octal_to_permissions_mode(octal="0o7") == "007"
 
     with pytest.raises(InvalidOctalError) as exc_info:
         _ = from_octal_to_permissions_mode(octal="118")
@@ -132,3 +135,26 @@ def test_octal_permissions() -> None:
     assert octal_permission.write == stat.S_IWOTH
     assert octal_permission.execute == stat.S_IXOTH
     assert octal_permission.write_execute == stat.S_IWOTH | stat.S_IXOTH
+
+
+def test_get_permissions_mask() -> None:
+    """
+    Testing the 'get_permissions_mask' function which retrieves the decimal
+    representation of permissions for an authority from the static mask table.
+    """
+    assert get_permissions_mask("owner", read=True, write=True, execute=True) == (
+        stat.S_IRWXU
+    )
+    assert get_permissions_mask("group", read=True, write=False, execute=True) == (
+        stat.S_IRGRP | stat.S_IXGRP
+    )
+    assert get_permissions_mask("others", read=False, write=True, execute=False) == (
+        stat.S_IWOTH
+    )
+    assert get_permissions_mask("owner", read=False, write=False, execute=False) == 0
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = get_permissions_mask("world", read=True, write=True, execute=True)  # type: ignore[arg-type]
+    assert str(exc_info.value) == (
+        "Authority should be one of ('owner', 'group', 'others')"
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from unix_perms import InvalidOctalError, PermissionsMode, PermissionsPresets
+
+
+def test_permissions_presets_builtins() -> None:
+    """
+    Testing the built-in presets of the PermissionsPresets registry and the
+    reverse index from mode to preset names.
+    """
+    presets = PermissionsPresets()
+
+    assert "private-dir" in presets
+    assert presets.get("private-dir").permissions_mode == "700"
+    assert presets.get("public-readonly").permissions_mode == "444"
+    assert presets.names_for(0o755) == ("public-dir", "executable")
+    assert presets.names_for("660") == ("shared-group-rw",)
+    assert presets.names_for(0o123) == tuple()
+
+    with pytest.raises(KeyError):
+        _ = presets.get("missing")
+
+    with pytest.raises(InvalidOctalError):
+        _ = presets.names_for("999")
+
+
+def test_permissions_presets_classify() -> None:
+    """
+    Testing the 'classify' method of PermissionsPresets which finds the
+    closest presets to a mode by Hamming distance.
+    """
+    presets = PermissionsPresets()
+
+    match = presets.classify(0o700)
+    assert match.names == ("private-dir",)
+    assert match.distance == 0
+
+    match = presets.classify(PermissionsMode.from_octal_representation("754"))
+    assert match.names == ("public-dir", "executable")
+    assert match.distance == 1
+
+    match = presets.classify("664")
+    assert match.names == ("shared-group-rw", "public-file")
+    assert match.distance == 1
+
+    empty_presets = PermissionsPresets(include_builtins=False)
+    assert len(empty_presets) == 0
+    assert empty_presets.classify(0o777).names == tuple()
+    assert empty_presets.classify(0o777).distance is None
+
+
+def test_permissions_presets_register() -> None:
+    """
+    Testing registration and removal of user-defined presets, which must
+    update the precomputed indexes.
+    """
+    presets = PermissionsPresets(presets={"deploy-key": "400"}, include_builtins=False)
+    assert list(presets) == ["deploy-key"]
+
+    presets.register("world-writable", 0o777)
+    assert presets.classify(0o776).names == ("world-writable",)
+    assert presets.names_for(0o777) == ("world-writable",)
+
+    with pytest.raises(ValueError) as exc_info:
+        presets.register("deploy-key", 0o600)
+    assert str(exc_info.value) == "Preset 'deploy-key' is already registered"
+
+    presets.register("deploy-key", 0o600, overwrite=True)
+    assert presets.names_for(0o400) == tuple()
+    assert presets.names_for(0o600) == ("deploy-key",)
+
+    presets.unregister("world-writable")
+    assert presets.classify(0o776).names == ("deploy-key",)
+    assert presets.classify(0o776).distance == 6
+
+    with pytest.raises(KeyError):
+        presets.unregister("world-writable")
+
+    with pytest.raises(ValueError):
+        presets.register("", 0o600)
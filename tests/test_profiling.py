@@ -0,0 +1,66 @@
+import unix_perms
+from unix_perms import (
+    PermissionsMode,
+    disable_profiling,
+    enable_profiling,
+    get_profiling_stats,
+    get_profiling_stats_prometheus,
+    is_profiling_enabled,
+    reset_profiling,
+)
+from unix_perms import _octals, _types
+
+
+def test_profiling() -> None:
+    """
+    Testing the opt-in profiling hooks which count calls, errors and
+    cumulative time of the internals of unix_perms.
+    """
+    original = _octals.from_octal_to_permissions_mode
+    original_method = _types.PermissionsMode.__dict__[
+        "_generate_class_arguments_from_mode"
+    ]
+    reset_profiling()
+
+    enable_profiling()
+    try:
+        assert is_profiling_enabled()
+        assert _octals.from_octal_to_permissions_mode is not original
+        assert unix_perms.from_octal_to_permissions_mode is not original
+
+        _ = PermissionsMode.from_octal_representation("755")
+        assert unix_perms.is_permissions_mode("755")
+        assert not unix_perms.is_permissions_mode("999")
+    finally:
+        disable_profiling()
+
+    assert not is_profiling_enabled()
+    assert _octals.from_octal_to_permissions_mode is original
+    assert unix_perms.from_octal_to_permissions_mode is original
+    assert (
+        _types.PermissionsMode.__dict__["_generate_class_arguments_from_mode"]
+        is original_method
+    )
+
+    stats = get_profiling_stats()
+    assert stats["from_octal_to_permissions_mode"]["calls"] == 3
+    assert stats["from_octal_to_permissions_mode"]["errors"] == 1
+    assert stats["is_permissions_mode"]["calls"] == 2
+    assert stats["is_permissions_mode"]["errors"] == 0
+    assert stats["PermissionsMode._generate_class_arguments_from_mode"]["calls"] == 1
+    assert stats["PermissionsMode._generate_class_arguments_from_decimal"]["calls"] == 1
+    assert stats["is_permissions_mode"]["total_time"] > 0
+
+    # Calls made while disabled are not counted
+    _ = PermissionsMode.from_octal_representation("755")
+    assert get_profiling_stats() == stats
+
+    prometheus = get_profiling_stats_prometheus()
+    assert "# TYPE unix_perms_calls_total counter" in prometheus
+    assert (
+        'unix_perms_errors_total{function="from_octal_to_permissions_mode"} 1'
+        in prometheus
+    )
+
+    reset_profiling()
+    assert get_profiling_stats() == {}
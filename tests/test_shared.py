@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from typing import List, Tuple
+
+import pytest
+
+import unix_perms
+from unix_perms import FileMetadata, SharedMetadata
+
+ENTRIES = [
+    FileMetadata("/srv", 0o755, 0, 0, "directory"),
+    FileMetadata("/srv/run", 0o4755, 1000, 100, "file"),
+    FileMetadata("/srv/données", 0o644, 1000, 100, "file"),
+    FileMetadata("/srv/link", 0o777, 0, 0, "symlink"),
+    FileMetadata("member.txt", 0o644, -1, -1, "file"),
+]
+
+
+def _read_export(name: str) -> Tuple[List[int], List[str], int]:
+    """
+    Reads an export from another process.
+    """
+    with SharedMetadata.attach(name) as shared:
+        modes = list(shared.modes)
+        paths = [shared.path(index) for index in range(len(shared))]
+        count = shared.distribution[0o644]
+    return modes, paths, count
+
+
+def test_shared_metadata_roundtrip() -> None:
+    """
+    Testing the SharedMetadata class which exports entries into shared memory
+    as typed arrays.
+    """
+    shared = SharedMetadata.create(ENTRIES)
+    try:
+        assert len(shared) == 5
+        assert shared.modes.format == "H"
+        assert list(shared.modes) == [0o755, 0o4755, 0o644, 0o777, 0o644]
+        assert list(shared.uids)[:3] == [0, 1000, 1000]
+        assert shared.uids[4] == 0xFFFFFFFF
+        assert list(shared.path_offsets)[:2] == [0, 4]
+        assert shared.path(2) == "/srv/données"
+
+        assert shared.distribution[0o644] == 2
+        assert shared.distribution[0o755] == 2
+        assert shared.distribution[0o777] == 0
+        assert sum(shared.distribution) == 4
+
+        assert list(shared) == ENTRIES
+
+        with pytest.raises(IndexError):
+            _ = shared.path(5)
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_shared_metadata_other_process() -> None:
+    """
+    Testing that another process can attach to an export by name.
+    """
+    with SharedMetadata.create(ENTRIES) as shared:
+        try:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(1) as pool:
+                modes, paths, count = pool.apply(_read_export, (shared.name,))
+        finally:
+            shared.unlink()
+
+    assert modes == [0o755, 0o4755, 0o644, 0o777, 0o644]
+    assert paths == [entry.path for entry in ENTRIES]
+    assert count == 2
+
+
+def test_shared_metadata_empty() -> None:
+    """
+    Testing an export without entries and attaching to a block that is not
+    an export.
+    """
+    with SharedMetadata.create([]) as shared:
+        assert len(shared) == 0
+        assert list(shared) == []
+        assert sum(shared.distribution) == 0
+        shared.unlink()
+
+    block = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            _ = SharedMetadata.attach(block.name)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_shared_metadata_independent_processes() -> None:
+    """
+    Testing that independent interpreters can attach one after another, and
+    that a consumer exiting does not destroy the block for the others.
+    """
+    package_root = os.path.dirname(os.path.dirname(unix_perms.__file__))
+    environment = dict(os.environ, PYTHONPATH=package_root)
+
+    shared = SharedMetadata.create(ENTRIES)
+    try:
+        script = (
+            "from unix_perms import SharedMetadata\n"
+            f"with SharedMetadata.attach({shared.name!r}) as shared:\n"
+            "    print(list(shared.modes))\n"
+        )
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                env=environment,
+                check=False,
+            )
+            assert result.returncode == 0, result.stderr
+            assert result.stdout.strip() == str([0o755, 0o4755, 0o644, 0o777, 0o644])
+            assert "leaked" not in result.stderr
+
+        with SharedMetadata.attach(shared.name) as attached:
+            assert len(attached) == 5
+    finally:
+        shared.close()
+        shared.unlink()
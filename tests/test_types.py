@@ -73,6 +73,11 @@ def test_permissions_byte() -> None:
 
     assert isinstance(permission_mode, PermissionsMode)
     assert permission_mode.permissions_mode == "274"
+    assert owner_permissions.permissions.authority == "owner"
+    assert owner_permissions.permissions is PermissionsByte("owner").permissions
+
+    with pytest.raises(ValueError):
+        _ = PermissionsByte(authority="world")  # type: ignore[arg-type]
 
 
 def test_permissions_mode() -> None:
@@ -122,3 +127,36 @@ def test_permissions_mode() -> None:
     assert permission_mode_add.permissions_mode_as_octal_literal == "0o276"
     assert permission_mode_add.permissions_mode_as_int == 276
     assert permission_mode_add.permissions_mode_as_decimal_repr == 190
+
+
+def test_permissions_mode_from_octal_representation() -> None:
+    """
+    Testing the creation of PermissionsMode objects from octal
+    representations, where integers are decoded directly to their bits.
+    """
+    for mode in range(0o1000):
+        from_int = PermissionsMode.from_octal_representation(octal=mode)
+        from_str = PermissionsMode.from_octal_representation(octal=format(mode, "o"))
+
+        assert from_int.permissions_mode_as_decimal_repr == mode
+        assert from_int.permissions_mode == from_str.permissions_mode
+        for authority in ("owner", "group", "others"):
+            byte = getattr(from_int, authority)
+            assert byte.authority == authority
+            assert (
+                byte.permissions_mode == getattr(from_str, authority).permissions_mode
+            )
+
+    permissions_mode = PermissionsMode.from_octal_representation(octal=0o754)
+    assert permissions_mode.owner.read_permission
+    assert permissions_mode.owner.execute_permission
+    assert not permissions_mode.group.write_permission
+    assert permissions_mode.others.permissions_description == "Read permission only"
+
+    assert PermissionsMode.from_octal_representation(octal=True).permissions_mode == (
+        "001"
+    )
+
+    for octal in (-1, 0o1000, 1 << 64):
+        with pytest.raises(InvalidOctalError):
+            _ = PermissionsMode.from_octal_representation(octal=octal)
@@ -1,22 +1,124 @@
+from unix_perms._archives import (
+    ArchiveReport,
+    default_archive_policy,
+    inspect_archive,
+    iter_archive_members,
+    rewrite_archive_modes,
+)
+from unix_perms._audit import AuditSummary, ModeAudit
+from unix_perms._backends import (
+    MetadataBackend,
+    ScandirBackend,
+    StatxBackend,
+    get_metadata_backend,
+)
+from unix_perms._batch import (
+    MODE_INVALID_FORMAT,
+    MODE_INVALID_TYPE,
+    MODE_OK,
+    MODE_OUT_OF_RANGE,
+    NormalizedModes,
+    normalize_modes,
+)
+from unix_perms._directories import (
+    DirectoryState,
+    DirectoryTree,
+    InheritedPermissions,
+    apply_capital_x,
+    check_directory_mode,
+    is_traversable,
+)
 from unix_perms._exceptions import InvalidOctalError
+from unix_perms._index import PermissionsIndex, PermissionsQuery
+from unix_perms._inotify import InotifyWatcher
+from unix_perms._manifest import (
+    ConvergencePlan,
+    ConvergenceSummary,
+    ManifestEntry,
+    PermissionsManifest,
+    PlannedChange,
+    converge,
+    execute_plan,
+)
+from unix_perms._metadata import FileMetadata, OwnerResolver
+from unix_perms._oci import ImageReport, scan_oci_image
 from unix_perms._octals import (
     OctalConfig,
     from_octal_digit_to_config,
     from_octal_to_permissions_mode,
     is_permissions_mode,
 )
-from unix_perms._permissions import OctalPermissions
+from unix_perms._permissions import OctalPermissions, get_permissions_mask
+from unix_perms._profiling import (
+    FunctionStats,
+    disable_profiling,
+    enable_profiling,
+    get_profiling_stats,
+    get_profiling_stats_prometheus,
+    is_profiling_enabled,
+    reset_profiling,
+)
+from unix_perms._presets import PermissionsPresets, PresetMatch
+from unix_perms._shared import SharedMetadata
 from unix_perms._types import PermissionsByte, PermissionsConfig, PermissionsMode
 
 __version__ = "0.6.0"
 __all__ = [
+    "ArchiveReport",
+    "default_archive_policy",
+    "inspect_archive",
+    "iter_archive_members",
+    "rewrite_archive_modes",
+    "AuditSummary",
+    "MetadataBackend",
+    "ScandirBackend",
+    "StatxBackend",
+    "get_metadata_backend",
+    "MODE_INVALID_FORMAT",
+    "MODE_INVALID_TYPE",
+    "MODE_OK",
+    "MODE_OUT_OF_RANGE",
+    "NormalizedModes",
+    "normalize_modes",
+    "ConvergencePlan",
+    "ConvergenceSummary",
+    "ManifestEntry",
+    "PermissionsManifest",
+    "PlannedChange",
+    "converge",
+    "execute_plan",
+    "FileMetadata",
+    "ImageReport",
+    "scan_oci_image",
+    "OwnerResolver",
+    "InotifyWatcher",
+    "PermissionsIndex",
+    "PermissionsQuery",
+    "ModeAudit",
+    "DirectoryState",
+    "DirectoryTree",
+    "InheritedPermissions",
+    "apply_capital_x",
+    "check_directory_mode",
+    "is_traversable",
     "InvalidOctalError",
     "OctalPermissions",
     "from_octal_digit_to_config",
+    "get_permissions_mask",
     "from_octal_to_permissions_mode",
     "is_permissions_mode",
     "OctalConfig",
     "PermissionsByte",
     "PermissionsMode",
     "PermissionsConfig",
+    "PermissionsPresets",
+    "PresetMatch",
+    "SharedMetadata",
+    "FunctionStats",
+    "disable_profiling",
+    "enable_profiling",
+    "get_profiling_stats",
+    "get_profiling_stats_prometheus",
+    "is_profiling_enabled",
+    "reset_profiling",
 ]
@@ -0,0 +1,341 @@
+import os
+import shutil
+import stat
+import tarfile
+import zipfile
+from collections import Counter, namedtuple
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from unix_perms._metadata import FILE_TYPES, FileMetadata, file_type_from_mode
+from unix_perms._types import PermissionsMode, to_decimal_mode
+
+ArchiveReport = namedtuple("ArchiveReport", ["members", "distribution", "violations"])
+
+ArchivePolicy = Callable[[FileMetadata], Optional[str]]
+ModeRewrite = Union[
+    Mapping[str, Union[PermissionsMode, str, int]],
+    Callable[[FileMetadata], Optional[int]],
+]
+
+# Zip archives made on Unix store 'st_mode' in the high 16 bits of external_attr
+_ZIP_UNIX_SYSTEM = 3
+_ZIP_DOS_READ_ONLY = 0x01
+_ZIP_DOS_DIRECTORY = 0x10
+
+_TAR_FILE_TYPES: Dict[bytes, str] = {
+    tarfile.REGTYPE: "file",
+    tarfile.AREGTYPE: "file",
+    tarfile.CONTTYPE: "file",
+    tarfile.LNKTYPE: "file",
+    tarfile.DIRTYPE: "directory",
+    tarfile.SYMTYPE: "symlink",
+    tarfile.CHRTYPE: "character-device",
+    tarfile.BLKTYPE: "block-device",
+    tarfile.FIFOTYPE: "fifo",
+}
+
+# Every file type reported for archive members, which are the valid keys of a
+# mapping of modes passed to rewrite_archive_modes
+_MEMBER_FILE_TYPES: Tuple[str, ...] = (*FILE_TYPES.values(), "unknown")
+
+TarWriteMode = Literal["w|", "w|gz", "w|bz2", "w|xz"]
+
+_TAR_WRITE_MODES: Tuple[Tuple[Tuple[str, ...], TarWriteMode], ...] = (
+    ((".tar.gz", ".tgz"), "w|gz"),
+    ((".tar.bz2", ".tbz2"), "w|bz2"),
+    ((".tar.xz", ".txz"), "w|xz"),
+)
+
+
+def tar_member_metadata(member: tarfile.TarInfo) -> FileMetadata:
+    """
+    Creates a FileMetadata record from a tar member.
+
+    Args:
+        member (tarfile.TarInfo): The tar member.
+
+    Returns:
+        FileMetadata: A new instance of FileMetadata for the member.
+    """
+    return FileMetadata(
+        path=member.name,
+        mode=stat.S_IMODE(member.mode),
+        uid=member.uid,
+        gid=member.gid,
+        file_type=_TAR_FILE_TYPES.get(member.type, "unknown"),
+    )
+
+
+def _zip_st_mode(info: zipfile.ZipInfo) -> int:
+    """
+    Private function to decode the 'st_mode' of a zip member from its
+    external attributes, falling back to the MS-DOS attributes for archives
+    not made on Unix.
+    """
+    if info.create_system == _ZIP_UNIX_SYSTEM:
+        st_mode: int = info.external_attr >> 16
+        if st_mode:
+            if not stat.S_IFMT(st_mode):
+                st_mode |= stat.S_IFDIR if info.is_dir() else stat.S_IFREG
+            return st_mode
+
+    if info.is_dir() or info.external_attr & _ZIP_DOS_DIRECTORY:
+        return stat.S_IFDIR | 0o755
+    elif info.external_attr & _ZIP_DOS_READ_ONLY:
+        return stat.S_IFREG | 0o444
+    else:
+        return stat.S_IFREG | 0o644
+
+
+def _zip_member_metadata(info: zipfile.ZipInfo) -> FileMetadata:
+    """
+    Private function to create a FileMetadata record from a zip member. Zip
+    archives do not record owners, so uid and gid are -1.
+    """
+    st_mode: int = _zip_st_mode(info=info)
+    return FileMetadata(
+        path=info.filename,
+        mode=stat.S_IMODE(st_mode),
+        uid=-1,
+        gid=-1,
+        file_type=file_type_from_mode(st_mode=st_mode),
+    )
+
+
+def iter_archive_members(path: str) -> Iterator[FileMetadata]:
+    """
+    Streams the members of a tar or zip archive as FileMetadata records,
+    without extracting anything to disk. Tar archives may be compressed with
+    gzip, bzip2 or xz.
+
+    Args:
+        path (str): The path of the archive.
+
+    Returns:
+        Iterator[FileMetadata]: A record for each member, in archive order.
+            Zip archives do not record owners, so uid and gid are -1.
+
+    Raises:
+        ValueError: If the file is neither a tar nor a zip archive.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                yield _zip_member_metadata(info=info)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path, mode="r|*") as archive:
+            for member in archive:
+                yield tar_member_metadata(member=member)
+    else:
+        raise ValueError("Expected a tar or zip archive")
+
+
+def default_archive_policy(member: FileMetadata) -> Optional[str]:
+    """
+    The default policy for archive inspection, which flags world-writable
+    members and members with the setuid or setgid bit set. World-writable
+    directories with the sticky bit set (e.g., '/tmp') are allowed.
+
+    Args:
+        member (FileMetadata): The archive member to check.
+
+    Returns:
+        str | None: A description of the violation, or None if there is none.
+    """
+    if member.file_type == "symlink":
+        return None
+    elif member.is_setuid:
+        return "setuid bit is set"
+    elif member.is_setgid and member.file_type != "directory":
+        return "setgid bit is set"
+    elif member.mode & stat.S_IWOTH and not (
+        member.file_type == "directory" and member.is_sticky
+    ):
+        return "world-writable"
+    else:
+        return None
+
+
+def inspect_archive(
+    path: str, policy: Optional[ArchivePolicy] = default_archive_policy
+) -> ArchiveReport:
+    """
+    Streams the members of a tar or zip archive, reporting the distribution
+    of Unix permissions modes and any policy violations.
+
+    Args:
+        path (str): The path of the archive.
+        policy (Callable[[FileMetadata], str | None] | None): A callable that
+            returns a description of the violation for a member, or None. If
+            None, no policy is applied.
+
+    Returns:
+        ArchiveReport: A named tuple containing the number of members, the
+            number of members for each Unix permissions mode, and a list of
+            (member name, violation) tuples.
+    """
+    members = 0
+    distribution: Counter[str] = Counter()
+    violations: List[Tuple[str, str]] = []
+
+    for member in iter_archive_members(path=path):
+        members += 1
+        if member.file_type != "symlink":
+            distribution[member.permissions_mode] += 1
+
+        if policy is not None:
+            violation: Optional[str] = policy(member)
+            if violation is not None:
+                violations.append((member.path, violation))
+
+    return ArchiveReport(
+        members=members,
+        distribution=dict(sorted(distribution.items())),
+        violations=violations,
+    )
+
+
+def _mode_rewriter(modes: ModeRewrite) -> Callable[[FileMetadata], Optional[int]]:
+    """
+    Private function to normalize the modes argument of rewrite_archive_modes
+    into a callable.
+    """
+    if callable(modes):
+        return modes
+
+    for file_type in modes:
+        if file_type not in _MEMBER_FILE_TYPES:
+            file_types = ", ".join(
+                repr(member_type) for member_type in _MEMBER_FILE_TYPES
+            )
+            raise ValueError(f"File type should be one of ({file_types})")
+
+    modes_by_type: Dict[str, int] = {
+        file_type: to_decimal_mode(mode=mode) for file_type, mode in modes.items()
+    }
+
+    def rewriter(member: FileMetadata) -> Optional[int]:
+        return modes_by_type.get(member.file_type)
+
+    return rewriter
+
+
+def _rewrite_tar(
+    source: str,
+    destination: str,
+    rewriter: Callable[[FileMetadata], Optional[int]],
+) -> int:
+    """
+    Private function to rewrite the member modes of a tar archive in a
+    single streaming pass.
+    """
+    write_mode: TarWriteMode = "w|"
+    for suffixes, mode in _TAR_WRITE_MODES:
+        if destination.endswith(suffixes):
+            write_mode = mode
+            break
+
+    rewritten = 0
+    with tarfile.open(source, mode="r|*") as source_archive, tarfile.open(
+        destination, mode=write_mode, format=tarfile.PAX_FORMAT
+    ) as destination_archive:
+        for member in source_archive:
+            new_mode: Optional[int] = rewriter(tar_member_metadata(member=member))
+            if new_mode is not None and new_mode != stat.S_IMODE(member.mode):
+                member.mode = new_mode
+                rewritten += 1
+
+            fileobj = source_archive.extractfile(member) if member.isreg() else None
+            destination_archive.addfile(member, fileobj)
+
+    return rewritten
+
+
+def _rewrite_zip(
+    source: str,
+    destination: str,
+    rewriter: Callable[[FileMetadata], Optional[int]],
+) -> int:
+    """
+    Private function to rewrite the member modes of a zip archive in a
+    single streaming pass.
+    """
+    rewritten = 0
+    with zipfile.ZipFile(source) as source_archive, zipfile.ZipFile(
+        destination, mode="w"
+    ) as destination_archive:
+        for info in source_archive.infolist():
+            st_mode: int = _zip_st_mode(info=info)
+            new_mode: Optional[int] = rewriter(_zip_member_metadata(info=info))
+            if new_mode is not None and new_mode != stat.S_IMODE(st_mode):
+                st_mode = stat.S_IFMT(st_mode) | new_mode
+                rewritten += 1
+
+            new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            new_info.compress_type = info.compress_type
+            new_info.comment = info.comment
+            new_info.extra = info.extra
+            new_info.create_system = _ZIP_UNIX_SYSTEM
+            new_info.external_attr = (st_mode << 16) | (info.external_attr & 0xFFFF)
+            new_info.file_size = info.file_size
+
+            if info.is_dir():
+                destination_archive.writestr(new_info, b"")
+                continue
+
+            with source_archive.open(info) as source_file, destination_archive.open(
+                new_info, mode="w"
+            ) as destination_file:
+                shutil.copyfileobj(source_file, destination_file)
+
+    return rewritten
+
+
+def rewrite_archive_modes(source: str, destination: str, modes: ModeRewrite) -> int:
+    """
+    Rewrites the modes of the members of a tar or zip archive into a new
+    archive in a single streaming pass, without extracting anything to disk.
+
+    The destination is written in the same format as the source. For tar
+    archives, compression is chosen from the suffix of the destination
+    ('.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz').
+
+    Args:
+        source (str): The path of the source archive.
+        destination (str): The path of the new archive.
+        modes (Mapping[str, PermissionsMode | str | int] | Callable): Either
+            the new mode for each file type (e.g., {'file': 0o644,
+            'directory': 0o755}), or a callable that returns the new permission
+            bits for a member, or None to keep them unchanged.
+
+    Returns:
+        int: The number of members whose mode was changed.
+
+    Raises:
+        ValueError: If the source is neither a tar nor a zip archive, if the
+            destination is the same file as the source, or if a key of
+            'modes' is not a file type (e.g., 'files').
+    """
+    # The destination is truncated before the source is read, so rewriting
+    # an archive onto itself would destroy it
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise ValueError("Destination must be a different file than the source")
+
+    rewriter = _mode_rewriter(modes=modes)
+
+    if zipfile.is_zipfile(source):
+        return _rewrite_zip(source=source, destination=destination, rewriter=rewriter)
+    elif tarfile.is_tarfile(source):
+        return _rewrite_tar(source=source, destination=destination, rewriter=rewriter)
+    else:
+        raise ValueError("Expected a tar or zip archive")
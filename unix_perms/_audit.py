@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+from collections import Counter, namedtuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+AuditSummary = namedtuple(
+    "AuditSummary",
+    ["directories_checked", "directories_rescanned", "files_checked", "elapsed"],
+)
+
+_STATE_VERSION = 1
+
+# Directories whose ctime falls this close to the start of the previous run
+# may have changed within the same filesystem clock tick, so they are rescanned
+_RACY_MARGIN_NS = 1_000_000_000
+
+
+class _DirectoryRecord:
+    """
+    Private structure holding the state of a single scanned directory.
+    """
+
+    __slots__ = ("ctime_ns", "mode", "files", "subdirectories")
+
+    def __init__(
+        self,
+        ctime_ns: int,
+        mode: int,
+        files: Dict[str, int],
+        subdirectories: List[str],
+    ):
+        self.ctime_ns = ctime_ns
+        self.mode = mode
+        self.files = files
+        self.subdirectories = subdirectories
+
+
+def _list_directory(path: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Private function to list a directory, returning the permissions mode of
+    every non-directory entry and the names of all subdirectories. Symbolic
+    links are skipped.
+    """
+    files: Dict[str, int] = dict()
+    subdirectories: List[str] = []
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.name)
+                    else:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        files[entry.name] = stat.S_IMODE(entry_stat.st_mode) & 0o777
+                except FileNotFoundError:
+                    continue
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        pass
+
+    return files, subdirectories
+
+
+class ModeAudit:
+    """
+    An incremental audit of the distribution of Unix permissions modes
+    across a directory tree.
+
+    The state of every directory, indexed by its ctime, is kept so that later
+    runs only list and stat the entries of directories whose ctime changed.
+    A directory's ctime changes when entries are added, removed or renamed,
+    or when its own mode changes, but not when the mode of a file inside it
+    changes. Those changes are picked up by passing the affected directories
+    explicitly (e.g. from an InotifyWatcher) or by setting 'verify_files'.
+
+    Directories whose ctime falls within 'racy_margin_ns' of the start of
+    the previous run are always rescanned, since they may have changed again
+    within the same filesystem clock tick.
+
+    Args:
+        root (str): The root directory of the tree to audit.
+        racy_margin_ns (int): The margin, in nanoseconds, before the start of
+            the previous run within which directories are always rescanned.
+    """
+
+    def __init__(self, root: str, racy_margin_ns: int = _RACY_MARGIN_NS):
+        self.root = os.path.abspath(root)
+        self.racy_margin_ns = racy_margin_ns
+
+        self._directories: Dict[str, _DirectoryRecord] = dict()
+        self._distribution: Counter[int] = Counter()
+        self._last_started_ns: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} root={self.root} "
+            f"directories={len(self._directories)}>"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    @property
+    def distribution(self) -> Dict[str, int]:
+        """
+        The number of files and directories for each Unix permissions mode.
+        """
+        return {
+            format(mode, "o").zfill(3): count
+            for mode, count in sorted(self._distribution.items())
+            if count
+        }
+
+    @property
+    def total(self) -> int:
+        """The total number of files and directories audited."""
+        return sum(self._distribution.values())
+
+    def _add_record(self, path: str, record: _DirectoryRecord) -> None:
+        """
+        Private method to add a directory record and its counts.
+        """
+        self._directories[path] = record
+        self._distribution[record.mode] += 1
+        self._distribution.update(record.files.values())
+
+    def _drop_record(self, path: str) -> None:
+        """
+        Private method to remove a directory record and its counts, along with
+        the records of all of its subdirectories.
+        """
+        stack: List[str] = [path]
+        while stack:
+            current_path = stack.pop()
+            record = self._directories.pop(current_path, None)
+            if record is None:
+                continue
+
+            self._distribution[record.mode] -= 1
+            self._distribution.subtract(record.files.values())
+            stack.extend(
+                os.path.join(current_path, name) for name in record.subdirectories
+            )
+
+    def _rescan_directory(
+        self, path: str, directory_stat: os.stat_result
+    ) -> _DirectoryRecord:
+        """
+        Private method to list and stat the entries of a directory and update
+        the aggregated counts in place.
+        """
+        previous = self._directories.pop(path, None)
+        if previous is not None:
+            self._distribution[previous.mode] -= 1
+            self._distribution.subtract(previous.files.values())
+
+        files, subdirectories = _list_directory(path=path)
+        record = _DirectoryRecord(
+            ctime_ns=directory_stat.st_ctime_ns,
+            mode=stat.S_IMODE(directory_stat.st_mode) & 0o777,
+            files=files,
+            subdirectories=subdirectories,
+        )
+        self._add_record(path=path, record=record)
+
+        if previous is not None:
+            for name in set(previous.subdirectories).difference(subdirectories):
+                self._drop_record(path=os.path.join(path, name))
+
+        return record
+
+    def _verify_files(self, path: str, record: _DirectoryRecord) -> None:
+        """
+        Private method to re-stat the files of an unchanged directory and
+        update any modes that differ.
+        """
+        for name, mode in record.files.items():
+            try:
+                file_stat = os.lstat(os.path.join(path, name))
+            except FileNotFoundError:
+                continue
+
+            current_mode = stat.S_IMODE(file_stat.st_mode) & 0o777
+            if current_mode != mode:
+                record.files[name] = current_mode
+                self._distribution[mode] -= 1
+                self._distribution[current_mode] += 1
+
+    def scan(self) -> AuditSummary:
+        """
+        Discards any existing state and scans the whole tree.
+
+        Returns:
+            AuditSummary: A named tuple summarizing the work done.
+        """
+        self._directories.clear()
+        self._distribution.clear()
+        self._last_started_ns = None
+        return self.update()
+
+    def update(
+        self,
+        changed_directories: Optional[Iterable[str]] = None,
+        verify_files: bool = False,
+    ) -> AuditSummary:
+        """
+        Incrementally updates the audit, rescanning only directories whose
+        ctime changed, that are new, or that are listed in
+        'changed_directories'.
+
+        File mode changes do not change the ctime of their directory, so
+        without 'changed_directories' or 'verify_files' they are missed and
+        the distribution stays stale for those files.
+
+        Args:
+            changed_directories (Iterable[str] | None): Directories known to
+                have changed, which are rescanned regardless of their ctime.
+            verify_files (bool): A boolean indicating whether the files of
+                unchanged directories should be re-stated to detect mode
+                changes that do not affect the ctime of their directory.
+
+        Returns:
+            AuditSummary: A named tuple summarizing the work done.
+        """
+        started = time.perf_counter()
+        started_ns = time.time_ns()
+        forced: Set[str] = {
+            os.path.abspath(directory) for directory in changed_directories or ()
+        }
+
+        racy_threshold_ns: Optional[int] = None
+        if self._last_started_ns is not None:
+            racy_threshold_ns = self._last_started_ns - self.racy_margin_ns
+
+        directories_checked = 0
+        directories_rescanned = 0
+        files_checked = 0
+
+        stack: List[str] = [self.root]
+        while stack:
+            path = stack.pop()
+            directories_checked += 1
+
+            try:
+                directory_stat = os.lstat(path)
+            except FileNotFoundError:
+                self._drop_record(path=path)
+                continue
+
+            if not stat.S_ISDIR(directory_stat.st_mode):
+                self._drop_record(path=path)
+                continue
+
+            record = self._directories.get(path)
+            if (
+                record is None
+                or path in forced
+                or record.ctime_ns != directory_stat.st_ctime_ns
+                or racy_threshold_ns is None
+                or record.ctime_ns >= racy_threshold_ns
+            ):
+                record = self._rescan_directory(
+                    path=path, directory_stat=directory_stat
+                )
+                directories_rescanned += 1
+                files_checked += len(record.files)
+            elif verify_files:
+                self._verify_files(path=path, record=record)
+                files_checked += len(record.files)
+
+            stack.extend(os.path.join(path, name) for name in record.subdirectories)
+
+        self._last_started_ns = started_ns
+        return AuditSummary(
+            directories_checked=directories_checked,
+            directories_rescanned=directories_rescanned,
+            files_checked=files_checked,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def save(self, state_file: str) -> None:
+        """
+        Persists the audit state to a JSON file.
+
+        Args:
+            state_file (str): The path of the state file.
+        """
+        state = {
+            "version": _STATE_VERSION,
+            "root": self.root,
+            "last_started_ns": self._last_started_ns,
+            "directories": {
+                path: [
+                    record.ctime_ns,
+                    record.mode,
+                    record.files,
+                    record.subdirectories,
+                ]
+                for path, record in self._directories.items()
+            },
+        }
+
+        temporary_file = f"{state_file}.tmp"
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            json.dump(state, file, separators=(",", ":"))
+        os.replace(temporary_file, state_file)
+
+    @classmethod
+    def load(cls, state_file: str, racy_margin_ns: int = _RACY_MARGIN_NS) -> ModeAudit:
+        """
+        Creates a ModeAudit instance from a persisted state file.
+
+        Args:
+            state_file (str): The path of the state file.
+            racy_margin_ns (int): The margin, in nanoseconds, before the start
+                of the previous run within which directories are always
+                rescanned.
+
+        Returns:
+            ModeAudit: A new instance of ModeAudit with the persisted state.
+
+        Raises:
+            ValueError: If the state file has an unsupported version.
+        """
+        with open(state_file, "r", encoding="utf-8") as file:
+            state = json.load(file)
+
+        if state.get("version") != _STATE_VERSION:
+            raise ValueError("Unsupported audit state file version")
+
+        audit = cls(root=state["root"], racy_margin_ns=racy_margin_ns)
+        audit._last_started_ns = state["last_started_ns"]
+        for path, (ctime_ns, mode, files, subdirectories) in state[
+            "directories"
+        ].items():
+            record = _DirectoryRecord(
+                ctime_ns=ctime_ns,
+                mode=mode,
+                files=files,
+                subdirectories=subdirectories,
+            )
+            audit._add_record(path=path, record=record)
+
+        return audit
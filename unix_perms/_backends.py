@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import stat
+import struct
+import sys
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Optional, Type
+
+from unix_perms._metadata import FileMetadata, file_type_from_mode
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_SYNC_AS_STAT = 0x0000
+
+STATX_TYPE = 0x0001
+STATX_MODE = 0x0002
+STATX_UID = 0x0008
+STATX_GID = 0x0010
+
+# Only the fields needed for FileMetadata are requested from the kernel
+STATX_MASK = STATX_TYPE | STATX_MODE | STATX_UID | STATX_GID
+
+# struct statx { __u32 stx_mask; __u32 stx_blksize; __u64 stx_attributes;
+# __u32 stx_nlink; __u32 stx_uid; __u32 stx_gid; __u16 stx_mode; ... }
+_STATX_HEADER = struct.Struct("=IIQIIIH")
+_STATX_SIZE = 256
+
+_SKIPPED_DIRECTORY_ERRORS = (FileNotFoundError, NotADirectoryError, PermissionError)
+
+
+class MetadataBackend(ABC):
+    """
+    The abstract base class of backends retrieving the metadata of files from
+    the kernel. Subclasses must implement 'metadata' and 'walk'.
+    """
+
+    name: str = ""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name}>"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        A boolean method which determines if the backend can be used on this
+        platform.
+
+        Returns:
+            bool: A boolean indicating whether the backend is available.
+        """
+        return True
+
+    @abstractmethod
+    def metadata(self, path: str) -> FileMetadata:
+        """
+        Retrieves the metadata of a single path, without following symbolic
+        links.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            FileMetadata: A new instance of FileMetadata for the path.
+        """
+
+    @abstractmethod
+    def walk(self, root: str, include_root: bool = False) -> Iterator[FileMetadata]:
+        """
+        Lazily walks a directory tree, yielding the metadata of every entry
+        below the root. Symbolic links are yielded but not followed, and
+        entries that vanish or directories that cannot be read are skipped.
+
+        Args:
+            root (str): The root directory of the tree.
+            include_root (bool): A boolean indicating whether the root itself
+                should be yielded first.
+
+        Returns:
+            Iterator[FileMetadata]: The metadata of every entry, with absolute
+                paths.
+        """
+
+
+class ScandirBackend(MetadataBackend):
+    """
+    The default backend, built on os.scandir. Directories are recognized from
+    the file type reported with each directory entry (d_type), and each entry
+    is stat'ed at most once through its cached stat result.
+    """
+
+    name = "scandir"
+
+    def metadata(self, path: str) -> FileMetadata:
+        return FileMetadata.from_path(path=path)
+
+    def walk(self, root: str, include_root: bool = False) -> Iterator[FileMetadata]:
+        root = os.path.abspath(root)
+        if include_root:
+            yield self.metadata(path=root)
+
+        stack: List[str] = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            entry_stat = entry.stat(follow_symlinks=False)
+                        except FileNotFoundError:
+                            continue
+
+                        yield FileMetadata.from_stat(
+                            path=entry.path, stat_result=entry_stat
+                        )
+            except _SKIPPED_DIRECTORY_ERRORS:
+                continue
+
+
+def _load_statx() -> Optional[Callable[..., int]]:
+    """
+    Private function to load and declare the statx function of the C
+    library, returning None if it is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+
+    # Arguments are only ever ints, bytes and a ctypes buffer, which ctypes
+    # converts correctly by default, and declaring argtypes makes every call
+    # noticeably slower
+    statx.restype = ctypes.c_int
+    function: Callable[..., int] = statx
+    return function
+
+
+class StatxBackend(MetadataBackend):
+    """
+    A Linux backend calling statx, through ctypes, requesting only the type,
+    mode, uid and gid of each file. Directories are listed through a file
+    descriptor (readdir, backed by getdents64) and their entries are
+    stat'ed relative to it, so the kernel does not resolve the full path of
+    every entry.
+
+    Raises:
+        OSError: If statx is unavailable (it requires Linux 4.11 and glibc
+            2.28 or later).
+    """
+
+    name = "statx"
+
+    _statx_function: Optional[Callable[..., int]] = None
+    _loaded: bool = False
+
+    def __init__(self) -> None:
+        statx = self._load()
+        if statx is None:
+            raise OSError("statx is only available on Linux with glibc 2.28+")
+        self._function = statx
+
+    @classmethod
+    def _load(cls) -> Optional[Callable[..., int]]:
+        """
+        Private method to load the statx function once per process.
+        """
+        if not cls._loaded:
+            cls._statx_function = _load_statx()
+            cls._loaded = True
+        return cls._statx_function
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return cls._load() is not None
+
+    def _check_result(self, result: int, name: str) -> bool:
+        """
+        Private method to check the result of a statx call, returning False
+        if the file vanished and raising for any other error.
+        """
+        if result == 0:
+            return True
+
+        error = ctypes.get_errno()
+        if error == errno.ENOENT:
+            return False
+        raise OSError(error, os.strerror(error), name)
+
+    def metadata(self, path: str) -> FileMetadata:
+        buffer = ctypes.create_string_buffer(_STATX_SIZE)
+        result = self._function(
+            AT_FDCWD,
+            os.fsencode(path),
+            AT_SYMLINK_NOFOLLOW | AT_STATX_SYNC_AS_STAT,
+            STATX_MASK,
+            buffer,
+        )
+        if not self._check_result(result=result, name=path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+        _, _, _, _, uid, gid, st_mode = _STATX_HEADER.unpack_from(buffer)
+        return FileMetadata(
+            path=path,
+            mode=stat.S_IMODE(st_mode),
+            uid=uid,
+            gid=gid,
+            file_type=file_type_from_mode(st_mode=st_mode),
+        )
+
+    def walk(self, root: str, include_root: bool = False) -> Iterator[FileMetadata]:
+        root = os.path.abspath(root)
+        if include_root:
+            yield self.metadata(path=root)
+
+        # The per-entry loop is the hot path, so it avoids method calls and
+        # attribute lookups and reuses a single buffer
+        statx = self._function
+        unpack_from = _STATX_HEADER.unpack_from
+        fsencode = os.fsencode
+        flags = AT_SYMLINK_NOFOLLOW | AT_STATX_SYNC_AS_STAT
+        buffer = ctypes.create_string_buffer(_STATX_SIZE)
+
+        stack: List[str] = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                directory_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except _SKIPPED_DIRECTORY_ERRORS:
+                continue
+
+            prefix = directory if directory.endswith("/") else f"{directory}/"
+            try:
+                for name in os.listdir(directory_fd):
+                    result = statx(
+                        directory_fd, fsencode(name), flags, STATX_MASK, buffer
+                    )
+                    if result and not self._check_result(result=result, name=name):
+                        continue
+
+                    _, _, _, _, uid, gid, st_mode = unpack_from(buffer)
+                    path = prefix + name
+                    if stat.S_ISDIR(st_mode):
+                        stack.append(path)
+                    yield FileMetadata(
+                        path,
+                        stat.S_IMODE(st_mode),
+                        uid,
+                        gid,
+                        file_type_from_mode(st_mode),
+                    )
+            except _SKIPPED_DIRECTORY_ERRORS:
+                continue
+            finally:
+                os.close(directory_fd)
+
+
+METADATA_BACKENDS: Dict[str, Type[MetadataBackend]] = {
+    ScandirBackend.name: ScandirBackend,
+    StatxBackend.name: StatxBackend,
+}
+
+
+def get_metadata_backend(name: Optional[str] = None) -> MetadataBackend:
+    """
+    Creates a metadata backend by name.
+
+    Args:
+        name (str | None): The name of the backend ('scandir' or 'statx'). If
+            None, the default 'scandir' backend is used.
+
+    Returns:
+        MetadataBackend: A new instance of the backend.
+
+    Raises:
+        ValueError: If 'name' is not a known backend.
+        OSError: If the backend is unavailable on this platform.
+    """
+    if name is None:
+        return ScandirBackend()
+
+    if name not in METADATA_BACKENDS:
+        backends = ", ".join(repr(backend) for backend in METADATA_BACKENDS)
+        raise ValueError(f"Backend should be one of ({backends})")
+
+    return METADATA_BACKENDS[name]()
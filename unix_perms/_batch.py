@@ -0,0 +1,127 @@
+import operator
+from array import array
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Union
+
+from unix_perms._types import PermissionsMode
+
+NormalizedModes = namedtuple("NormalizedModes", ["modes", "errors"])
+
+# Error codes reported per item by normalize_modes
+MODE_OK = 0
+MODE_INVALID_TYPE = 1
+MODE_INVALID_FORMAT = 2
+MODE_OUT_OF_RANGE = 3
+
+_OCTAL_LITERAL_PREFIXES = ("0o", "0O")
+_OCTAL_DIGITS = "01234567"
+_BUFFER_SEPARATORS = b","
+
+# Every valid mode keyed by its octal digits without leading zeros, so that
+# decoding a digit string is a single dictionary lookup
+_MODES_BY_DIGITS: Dict[str, int] = {format(mode, "o"): mode for mode in range(0o1000)}
+
+
+def _tokenize_buffer(buffer: Union[str, bytes, bytearray, memoryview]) -> List[str]:
+    """
+    Private function to split a text buffer into tokens on whitespace and
+    commas.
+    """
+    if isinstance(buffer, str):
+        return buffer.replace(",", " ").split()
+
+    data = bytes(buffer).replace(_BUFFER_SEPARATORS, b" ")
+    return data.decode("ascii", errors="replace").split()
+
+
+def normalize_modes(
+    values: Union[Iterable[Any], str, bytes, bytearray, memoryview],
+) -> NormalizedModes:
+    """
+    Normalizes a batch of mixed octal representations to the decimal
+    representations of Unix permissions modes, without raising on bad values.
+
+    Strings and bytes may be octal literals (e.g., '0o755') or Unix
+    permissions modes with or without leading zeros (e.g., '755', '0755' or
+    b'0755'), and integers must be decimal representations of an octal (e.g.,
+    493 or 0o755). PermissionsMode instances are also accepted.
+
+    Every value is first classified by format in a single pass, then each
+    format group is decoded in bulk through precomputed lookup tables.
+
+    Args:
+        values (Iterable | str | bytes | bytearray | memoryview): An iterable
+            of values, or a text buffer of values separated by whitespace or
+            commas.
+
+    Returns:
+        NormalizedModes: A named tuple containing an array of the decimal
+            representations of the modes ('H' typecode) and an array of error
+            codes ('B' typecode), one per value. Values that fail have a mode
+            of 0 and a non-zero error code (MODE_INVALID_TYPE,
+            MODE_INVALID_FORMAT or MODE_OUT_OF_RANGE).
+    """
+    items: Iterable[Any]
+    if isinstance(values, (str, bytes, bytearray, memoryview)):
+        items = _tokenize_buffer(buffer=values)
+    else:
+        items = values
+
+    # Pre-scan, classifying each value as an integer or a string of octal
+    # digits (with any octal literal prefix removed)
+    integer_indexes: List[int] = []
+    integers: List[int] = []
+    digit_indexes: List[int] = []
+    digits: List[str] = []
+    errors = array("B")
+
+    for index, value in enumerate(items):
+        errors.append(MODE_OK)
+        value_type = type(value)
+
+        if value_type is str or value_type is bytes or value_type is bytearray:
+            if value_type is not str:
+                value = value.decode("ascii", errors="replace")
+
+            token: str = value.strip()
+            if token.startswith(_OCTAL_LITERAL_PREFIXES):
+                token = token[2:]
+                if not token:
+                    errors[index] = MODE_INVALID_FORMAT
+                    continue
+
+            digit_indexes.append(index)
+            digits.append(token)
+        elif value_type is int:
+            integer_indexes.append(index)
+            integers.append(value)
+        elif isinstance(value, PermissionsMode):
+            integer_indexes.append(index)
+            integers.append(value.permissions_mode_as_decimal_repr)
+        elif value_type is not bool and hasattr(value_type, "__index__"):
+            integer_indexes.append(index)
+            integers.append(operator.index(value))
+        else:
+            errors[index] = MODE_INVALID_TYPE
+
+    modes = array("H", bytes(2 * len(errors)))
+
+    for index, integer in zip(integer_indexes, integers):
+        if 0 <= integer <= 0o777:
+            modes[index] = integer
+        else:
+            errors[index] = MODE_OUT_OF_RANGE
+
+    # An all-zero token keeps a single '0', while an empty token stays empty
+    # and is rejected by the lookup
+    modes_by_digits = _MODES_BY_DIGITS
+    for index, token in zip(digit_indexes, digits):
+        mode = modes_by_digits.get(token.lstrip("0") or token[:1])
+        if mode is not None:
+            modes[index] = mode
+        elif token and not token.strip(_OCTAL_DIGITS):
+            errors[index] = MODE_OUT_OF_RANGE
+        else:
+            errors[index] = MODE_INVALID_FORMAT
+
+    return NormalizedModes(modes=modes, errors=errors)
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import posixpath
+import stat
+from collections import namedtuple
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from unix_perms._backends import MetadataBackend, get_metadata_backend
+from unix_perms._metadata import FileMetadata
+from unix_perms._permissions import (
+    AUTHORITY_INDEX,
+    AUTHORITY_SHIFTS,
+    EXECUTE_BIT,
+    READ_BIT,
+    WRITE_BIT,
+    get_authority_index,
+)
+
+DirectoryState = namedtuple(
+    "DirectoryState",
+    ["path", "traversable", "inherited_gid", "new_file_mode", "new_directory_mode"],
+)
+InheritedPermissions = namedtuple("InheritedPermissions", ["gid", "mode"])
+
+AUTHORITIES: Tuple[str, ...] = tuple(AUTHORITY_INDEX)
+
+_EXECUTE_BITS = 0o111
+
+# The authorities whose execute bit is set, for every combination of the
+# three execute bits of a mode
+_AUTHORITIES_BY_EXECUTE_BITS: Dict[int, Tuple[str, ...]] = {
+    bits: tuple(
+        authority
+        for authority, shift in zip(AUTHORITIES, AUTHORITY_SHIFTS)
+        if bits >> shift & EXECUTE_BIT
+    )
+    for bits in range(0o1000)
+    if not bits & ~_EXECUTE_BITS
+}
+
+# Tree roots have no scanned parent, so every authority is assumed to reach them
+_ROOT_STATE: Tuple[int, Optional[int]] = (_EXECUTE_BITS, None)
+
+
+def _execute_bits(authorities: Iterable[str]) -> int:
+    """
+    Private function to create a mask of the execute bits of authorities.
+    """
+    bits = 0
+    for authority in authorities:
+        shift = AUTHORITY_SHIFTS[get_authority_index(authority=authority)]
+        bits |= EXECUTE_BIT << shift
+    return bits
+
+
+def apply_capital_x(
+    mode: int,
+    file_type: str,
+    authorities: Iterable[Literal["owner", "group", "others"]] = (
+        "owner",
+        "group",
+        "others",
+    ),
+) -> int:
+    """
+    Applies the capital-X rule of chmod (e.g., 'a+X'), which grants execute
+    permission only to directories and to files that already have execute
+    permission for at least one authority.
+
+    Args:
+        mode (int): The permission bits, including the setuid, setgid and
+            sticky bits.
+        file_type (str): The type of the file (e.g., 'file', 'directory').
+        authorities (Iterable[Literal['owner', 'group', 'others']]): The
+            authorities to grant execute permission to.
+
+    Returns:
+        int: The new permission bits.
+    """
+    if file_type == "directory" or mode & _EXECUTE_BITS:
+        return mode | _execute_bits(authorities=authorities)
+    return mode
+
+
+def is_traversable(mode: int, authority: Literal["owner", "group", "others"]) -> bool:
+    """
+    A boolean function which determines if an authority can traverse a
+    directory, that is access the entries inside it, which requires the
+    execute bit.
+
+    Args:
+        mode (int): The permission bits of the directory.
+        authority (Literal['owner', 'group', 'others']): A specific
+            permissions authority.
+
+    Returns:
+        bool: A boolean indicating whether the authority can traverse the
+            directory.
+    """
+    shift = AUTHORITY_SHIFTS[get_authority_index(authority=authority)]
+    return bool(mode >> shift & EXECUTE_BIT)
+
+
+def check_directory_mode(mode: int) -> List[str]:
+    """
+    Checks the permission bits of a directory for misconfigurations, where an
+    authority can read (list) or write (create and remove entries) without
+    being able to traverse the directory, which makes those permissions
+    largely unusable.
+
+    Args:
+        mode (int): The permission bits of the directory.
+
+    Returns:
+        List[str]: A description of every misconfiguration found.
+    """
+    issues: List[str] = []
+    for authority, shift in zip(AUTHORITIES, AUTHORITY_SHIFTS):
+        digit = mode >> shift & 0o7
+        if digit & EXECUTE_BIT:
+            continue
+
+        if digit & READ_BIT:
+            issues.append(f"{authority} can list but not traverse")
+        if digit & WRITE_BIT:
+            issues.append(f"{authority} can write but not traverse")
+
+    return issues
+
+
+class DirectoryTree:
+    """
+    File-type-aware permission semantics over the entries of a scanned tree,
+    covering traversability through ancestor directories and the group and
+    mode inherited by new entries under setgid directories.
+
+    The state of every directory is computed in a single pass over the
+    directories in path order, each from the already computed state of its
+    parent, so no ancestor is evaluated more than once.
+
+    An authority can reach a path when the execute bit of that authority is
+    set on every scanned ancestor directory. Directories whose parent was not
+    scanned (e.g., the root of the tree) are assumed to be reachable.
+
+    Args:
+        entries (Iterable[FileMetadata]): The entries of the tree.
+        umask (int): The umask applied to the mode of new entries.
+    """
+
+    def __init__(self, entries: Iterable[FileMetadata], umask: int = 0o022):
+        self._umask = umask
+        self._entries: Dict[str, FileMetadata] = {
+            entry.path.rstrip("/") or "/": entry for entry in entries
+        }
+
+        # Internal states hold the execute bits of the authorities that can
+        # traverse each directory and the gid inherited by new entries
+        self._states: Dict[str, Tuple[int, Optional[int]]] = dict()
+        for path in sorted(
+            path
+            for path, entry in self._entries.items()
+            if entry.file_type == "directory"
+        ):
+            entry = self._entries[path]
+            traversable, _ = self._parent_state(path=path)
+            self._states[path] = (
+                traversable & entry.mode & _EXECUTE_BITS,
+                entry.gid if entry.mode & stat.S_ISGID else None,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} entries={len(self._entries)} "
+            f"directories={len(self._states)}>"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    @classmethod
+    def from_tree(
+        cls,
+        root: str,
+        umask: int = 0o022,
+        backend: Optional[MetadataBackend] = None,
+    ) -> DirectoryTree:
+        """
+        Creates a DirectoryTree instance by scanning a directory tree,
+        including the root itself. Symbolic links are recorded but not
+        followed.
+
+        Args:
+            root (str): The root directory of the tree.
+            umask (int): The umask applied to the mode of new entries.
+            backend (MetadataBackend | None): The backend used to walk the
+                tree. If None, the default 'scandir' backend is used.
+
+        Returns:
+            DirectoryTree: A new instance of DirectoryTree.
+        """
+        if backend is None:
+            backend = get_metadata_backend()
+
+        return cls(entries=backend.walk(root=root, include_root=True), umask=umask)
+
+    def _parent_state(self, path: str) -> Tuple[int, Optional[int]]:
+        """
+        Private method to retrieve the internal state of the parent directory
+        of a path.
+        """
+        parent = posixpath.dirname(path)
+        if parent == path:
+            return _ROOT_STATE
+        return self._states.get(parent, _ROOT_STATE)
+
+    def _new_entry_modes(self, inherited_gid: Optional[int]) -> Tuple[int, int]:
+        """
+        Private method to compute the modes of new files and directories.
+        """
+        new_directory_mode = 0o777 & ~self._umask
+        if inherited_gid is not None:
+            new_directory_mode |= stat.S_ISGID
+        return 0o666 & ~self._umask, new_directory_mode
+
+    def state(self, path: str) -> DirectoryState:
+        """
+        Retrieves the state of a scanned directory.
+
+        Args:
+            path (str): The path of the directory.
+
+        Returns:
+            DirectoryState: A named tuple containing the path, the authorities
+                that can traverse the directory and all of its ancestors, the
+                gid inherited by new entries (None when the directory is not
+                setgid, so new entries take the primary group of their
+                creator), and the modes of new files and directories.
+
+        Raises:
+            KeyError: If 'path' is not a scanned directory.
+        """
+        path = path.rstrip("/") or "/"
+        if path not in self._states:
+            raise KeyError(f"No scanned directory at '{path}'")
+
+        traversable, inherited_gid = self._states[path]
+        new_file_mode, new_directory_mode = self._new_entry_modes(
+            inherited_gid=inherited_gid
+        )
+        return DirectoryState(
+            path=path,
+            traversable=_AUTHORITIES_BY_EXECUTE_BITS[traversable],
+            inherited_gid=inherited_gid,
+            new_file_mode=new_file_mode,
+            new_directory_mode=new_directory_mode,
+        )
+
+    def reachable_by(self, path: str) -> Tuple[str, ...]:
+        """
+        Retrieves the authorities that can reach a path, by traversing every
+        scanned ancestor directory.
+
+        Args:
+            path (str): The path of an entry.
+
+        Returns:
+            Tuple[str, ...]: The authorities that can reach the path.
+        """
+        traversable, _ = self._parent_state(path=path.rstrip("/") or "/")
+        return _AUTHORITIES_BY_EXECUTE_BITS[traversable]
+
+    def new_entry(
+        self, directory: str, is_directory: bool = False
+    ) -> InheritedPermissions:
+        """
+        Computes the group and mode of a new entry created in a scanned
+        directory. Under a setgid directory, new entries take the group of
+        the directory and new directories also inherit the setgid bit.
+
+        Args:
+            directory (str): The path of the parent directory.
+            is_directory (bool): A boolean indicating whether the new entry is
+                a directory.
+
+        Returns:
+            InheritedPermissions: A named tuple containing the inherited gid,
+                or None if new entries take the primary group of their
+                creator, and the mode of the new entry.
+        """
+        directory_state = self.state(path=directory)
+        mode = (
+            directory_state.new_directory_mode
+            if is_directory
+            else directory_state.new_file_mode
+        )
+        return InheritedPermissions(gid=directory_state.inherited_gid, mode=mode)
+
+    def issues(self) -> List[Tuple[str, str]]:
+        """
+        Finds directory misconfigurations across the tree: authorities that
+        can list or write a directory without traversing it, and
+        subdirectories of setgid directories that break group inheritance.
+
+        Returns:
+            List[Tuple[str, str]]: A list of (path, issue) tuples, sorted by
+                path.
+        """
+        issues: List[Tuple[str, str]] = []
+        for path in sorted(self._states):
+            entry = self._entries[path]
+            for issue in check_directory_mode(mode=entry.mode):
+                issues.append((path, issue))
+
+            parent = posixpath.dirname(path)
+            if parent == path or parent not in self._states:
+                continue
+
+            _, parent_gid = self._states[parent]
+            if parent_gid is None:
+                continue
+
+            if not entry.mode & stat.S_ISGID:
+                issues.append((path, "setgid bit not inherited from parent"))
+            elif entry.gid != parent_gid:
+                issues.append((path, "group differs from setgid parent"))
+
+        return issues
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import bisect
+import stat
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from unix_perms._backends import MetadataBackend, get_metadata_backend
+from unix_perms._metadata import FileMetadata
+from unix_perms._permissions import (
+    EXECUTE_BIT,
+    PERMISSIONS_MASKS,
+    READ_BIT,
+    WRITE_BIT,
+    get_authority_index,
+)
+from unix_perms._types import PermissionsMode, to_decimal_mode
+
+PERMISSION_BITS: Dict[str, int] = {
+    "read": READ_BIT,
+    "write": WRITE_BIT,
+    "execute": EXECUTE_BIT,
+}
+SPECIAL_BITS: Dict[str, int] = {
+    "setuid": stat.S_ISUID,
+    "setgid": stat.S_ISGID,
+    "sticky": stat.S_ISVTX,
+}
+
+# Positions of the twelve permission bits (rwx for each authority plus the
+# setuid, setgid and sticky bits), each of which gets its own bitmap
+_MODE_BITS: Tuple[int, ...] = tuple(range(12))
+_MODE_BIT_POSITIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in _MODE_BITS if mode >> bit & 1) for mode in range(1 << 12)
+)
+_BYTE_BIT_POSITIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def _bit_count(bitmap: int) -> int:
+    """
+    Private function to count the set bits of a bitmap.
+    """
+    return bin(bitmap).count("1")
+
+
+class PermissionsQuery:
+    """
+    A boolean query over the entries of a PermissionsIndex. Queries are
+    combined with '&', '|' and '~' and evaluate to bitmaps, so any
+    combination costs a handful of big integer operations.
+
+    Use the class methods 'has', 'lacks', 'special', 'of_type', 'mode' and
+    'under' to create queries.
+
+    Args:
+        evaluate (Callable[[PermissionsIndex], int]): A callable returning
+            the bitmap of matching entry ids for an index.
+    """
+
+    def __init__(self, evaluate: Callable[[PermissionsIndex], int]):
+        self._evaluate = evaluate
+
+    def __and__(self, query: PermissionsQuery) -> PermissionsQuery:
+        if not isinstance(query, PermissionsQuery):
+            return NotImplemented
+
+        return PermissionsQuery(
+            lambda index: self._evaluate(index) & query._evaluate(index)
+        )
+
+    def __or__(self, query: PermissionsQuery) -> PermissionsQuery:
+        if not isinstance(query, PermissionsQuery):
+            return NotImplemented
+
+        return PermissionsQuery(
+            lambda index: self._evaluate(index) | query._evaluate(index)
+        )
+
+    def __invert__(self) -> PermissionsQuery:
+        return PermissionsQuery(
+            lambda index: index._all_entries & ~self._evaluate(index)
+        )
+
+    def evaluate(self, index: PermissionsIndex) -> int:
+        """
+        Evaluates the query against an index.
+
+        Args:
+            index (PermissionsIndex): The index to evaluate against.
+
+        Returns:
+            int: A bitmap where bit i is set if entry i matches.
+        """
+        return self._evaluate(index)
+
+    @classmethod
+    def has(
+        cls,
+        authority: Literal["owner", "group", "others"],
+        permission: Literal["read", "write", "execute"],
+    ) -> PermissionsQuery:
+        """
+        Creates a query matching entries where an authority has a permission.
+
+        Args:
+            authority (Literal['owner', 'group', 'others']): A specific
+                permissions authority.
+            permission (Literal['read', 'write', 'execute']): A permission.
+
+        Returns:
+            PermissionsQuery: A new query.
+
+        Raises:
+            ValueError: If 'authority' or 'permission' is invalid.
+        """
+        if permission not in PERMISSION_BITS:
+            raise ValueError("Permission should be one of ('read', 'write', 'execute')")
+
+        authority_index: int = get_authority_index(authority=authority)
+        mask: int = PERMISSIONS_MASKS[authority_index][PERMISSION_BITS[permission]]
+        bit: int = mask.bit_length() - 1
+        return cls(lambda index: index._mode_bitmaps[bit])
+
+    @classmethod
+    def lacks(
+        cls,
+        authority: Literal["owner", "group", "others"],
+        permission: Literal["read", "write", "execute"],
+    ) -> PermissionsQuery:
+        """
+        Creates a query matching entries where an authority lacks a permission.
+
+        Args:
+            authority (Literal['owner', 'group', 'others']): A specific
+                permissions authority.
+            permission (Literal['read', 'write', 'execute']): A permission.
+
+        Returns:
+            PermissionsQuery: A new query.
+        """
+        return ~cls.has(authority=authority, permission=permission)
+
+    @classmethod
+    def special(cls, bit: Literal["setuid", "setgid", "sticky"]) -> PermissionsQuery:
+        """
+        Creates a query matching entries with a special mode bit set.
+
+        Args:
+            bit (Literal['setuid', 'setgid', 'sticky']): The special bit.
+
+        Returns:
+            PermissionsQuery: A new query.
+
+        Raises:
+            ValueError: If 'bit' is not one of ('setuid', 'setgid', 'sticky').
+        """
+        if bit not in SPECIAL_BITS:
+            raise ValueError("Bit should be one of ('setuid', 'setgid', 'sticky')")
+
+        position: int = SPECIAL_BITS[bit].bit_length() - 1
+        return cls(lambda index: index._mode_bitmaps[position])
+
+    @classmethod
+    def of_type(cls, file_type: str) -> PermissionsQuery:
+        """
+        Creates a query matching entries of a file type.
+
+        Args:
+            file_type (str): The file type (e.g., 'file', 'directory').
+
+        Returns:
+            PermissionsQuery: A new query.
+        """
+        return cls(lambda index: index._type_bitmaps.get(file_type, 0))
+
+    @classmethod
+    def mode(cls, mode: Union[PermissionsMode, str, int]) -> PermissionsQuery:
+        """
+        Creates a query matching entries whose read, write and execute bits
+        are exactly a mode.
+
+        Args:
+            mode (PermissionsMode | str | int): A PermissionsMode instance or
+                an octal representation as a string or integer.
+
+        Returns:
+            PermissionsQuery: A new query.
+        """
+        decimal_mode: int = to_decimal_mode(mode=mode)
+
+        def evaluate(index: PermissionsIndex) -> int:
+            bitmap: int = index._all_entries
+            for bit in range(9):
+                if decimal_mode >> bit & 1:
+                    bitmap &= index._mode_bitmaps[bit]
+                else:
+                    bitmap &= ~index._mode_bitmaps[bit]
+            return bitmap
+
+        return cls(evaluate)
+
+    @classmethod
+    def under(cls, prefix: str) -> PermissionsQuery:
+        """
+        Creates a query matching a path and every path below it.
+
+        Args:
+            prefix (str): The path prefix, matched on whole path components.
+
+        Returns:
+            PermissionsQuery: A new query.
+        """
+        return cls(lambda index: index._prefix_bitmap(prefix=prefix))
+
+
+class PermissionsIndex:
+    """
+    An inverted index over scanned entries for answering ad-hoc queries by
+    permission bits and path prefixes.
+
+    Each of the twelve permission bits has a bitmap of the entry ids that
+    have it set, and entries are sorted by path so that every path prefix
+    covers a contiguous range of ids, found by binary search.
+
+    Args:
+        entries (Iterable[FileMetadata]): The entries to index.
+    """
+
+    def __init__(self, entries: Iterable[FileMetadata]):
+        records: List[Tuple[str, int, str]] = sorted(
+            (entry.path.rstrip("/") or "/", entry.mode, entry.file_type)
+            for entry in entries
+        )
+
+        self._paths: List[str] = [path for path, _, _ in records]
+        self._all_entries: int = (1 << len(records)) - 1
+
+        size = (len(records) + 7) // 8
+        mode_bitmaps = [bytearray(size) for _ in _MODE_BITS]
+        type_bitmaps: Dict[str, bytearray] = dict()
+
+        for entry_id, (_, mode, file_type) in enumerate(records):
+            offset = entry_id >> 3
+            flag = 1 << (entry_id & 7)
+            for bit in _MODE_BIT_POSITIONS[mode & 0o7777]:
+                mode_bitmaps[bit][offset] |= flag
+
+            type_bitmap = type_bitmaps.get(file_type)
+            if type_bitmap is None:
+                type_bitmap = type_bitmaps[file_type] = bytearray(size)
+            type_bitmap[offset] |= flag
+
+        self._mode_bitmaps: List[int] = [
+            int.from_bytes(bitmap, "little") for bitmap in mode_bitmaps
+        ]
+        self._type_bitmaps: Dict[str, int] = {
+            file_type: int.from_bytes(bitmap, "little")
+            for file_type, bitmap in type_bitmaps.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} entries={len(self._paths)}>"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    @classmethod
+    def from_tree(
+        cls, root: str, backend: Optional[MetadataBackend] = None
+    ) -> PermissionsIndex:
+        """
+        Creates a PermissionsIndex instance by scanning a directory tree.
+        Symbolic links are indexed but not followed.
+
+        Args:
+            root (str): The root directory of the tree.
+            backend (MetadataBackend | None): The backend used to walk the
+                tree. If None, the default 'scandir' backend is used.
+
+        Returns:
+            PermissionsIndex: A new instance of PermissionsIndex.
+        """
+        if backend is None:
+            backend = get_metadata_backend()
+
+        return cls(entries=backend.walk(root=root))
+
+    def _range_bitmap(self, start: int, end: int) -> int:
+        """
+        Private method to create a bitmap with the ids in [start, end) set.
+        """
+        return ((1 << end) - 1) ^ ((1 << start) - 1)
+
+    def _prefix_bitmap(self, prefix: str) -> int:
+        """
+        Private method to create a bitmap of the entries at or below a path.
+        """
+        prefix = prefix.rstrip("/")
+        if not prefix:
+            return self._all_entries
+
+        paths = self._paths
+        exact_start = bisect.bisect_left(paths, prefix)
+        exact_end = bisect.bisect_right(paths, prefix)
+
+        # Paths below the prefix all start with 'prefix/' and sort together,
+        # before any path starting with 'prefix0' ('0' follows '/')
+        below_start = bisect.bisect_left(paths, prefix + "/")
+        below_end = bisect.bisect_left(paths, prefix + "0")
+
+        return self._range_bitmap(exact_start, exact_end) | self._range_bitmap(
+            below_start, below_end
+        )
+
+    def _iter_bitmap(self, bitmap: int) -> Iterator[str]:
+        """
+        Private method to lazily yield the paths of the set bits of a bitmap,
+        skipping empty 64-bit words.
+        """
+        size = (len(self._paths) + 63) // 64 * 8
+        data = bitmap.to_bytes(size, "little")
+        words = memoryview(data).cast("Q")
+        for word_index, word in enumerate(words):
+            if not word:
+                continue
+
+            base = word_index * 8
+            for byte_index in range(base, base + 8):
+                for bit in _BYTE_BIT_POSITIONS[data[byte_index]]:
+                    yield self._paths[byte_index * 8 + bit]
+
+    def query(self, query: PermissionsQuery) -> Iterator[str]:
+        """
+        Lazily retrieves the paths of all entries matching a query.
+
+        Args:
+            query (PermissionsQuery): The query to evaluate.
+
+        Returns:
+            Iterator[str]: The matching paths, in sorted order.
+        """
+        return self._iter_bitmap(bitmap=query.evaluate(index=self))
+
+    def count(self, query: PermissionsQuery) -> int:
+        """
+        Counts the entries matching a query.
+
+        Args:
+            query (PermissionsQuery): The query to evaluate.
+
+        Returns:
+            int: The number of matching entries.
+        """
+        return _bit_count(query.evaluate(index=self))
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import stat
+import time
+from collections import namedtuple
+from typing import Any, List, Literal, Optional, Pattern, Tuple, Union
+
+from pydantic import BaseModel, PrivateAttr, field_validator
+
+from unix_perms._exceptions import InvalidOctalError
+from unix_perms._presets import BUILTIN_PRESETS
+from unix_perms._types import PermissionsMode, to_decimal_mode
+
+PlannedChange = namedtuple("PlannedChange", ["path", "current_mode", "target_mode"])
+ConvergencePlan = namedtuple(
+    "ConvergencePlan", ["root", "changes", "entries_examined", "elapsed"]
+)
+ConvergenceSummary = namedtuple(
+    "ConvergenceSummary", ["changed", "failed", "errors", "elapsed"]
+)
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Private function to translate a glob pattern into a regular expression
+    without capturing groups. A '*' matches within a single path component,
+    while '**' matches across components.
+    """
+    index = 0
+    length = len(pattern)
+    parts: List[str] = []
+
+    while index < length:
+        character = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif character == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif character == "?":
+            parts.append("[^/]")
+            index += 1
+        elif character == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(character))
+                index += 1
+                continue
+
+            characters = pattern[index + 1 : end].replace("\\", "\\\\")
+            if characters.startswith("!"):
+                characters = "^" + characters[1:]
+            parts.append(f"[{characters}]")
+            index = end + 1
+        else:
+            parts.append(re.escape(character))
+            index += 1
+
+    return "".join(parts)
+
+
+class ManifestEntry(BaseModel):
+    """
+    A single entry of a permissions manifest, mapping a glob pattern to a
+    target Unix permissions mode.
+
+    Args:
+        pattern (str): A glob pattern relative to the root of the tree, using
+            '/' as separator. A '*' matches within a single path component and
+            '**' matches across components.
+        mode (str | PermissionsMode): The target mode as a string octal
+            representation (e.g., '755', '0755' or '0o755'), the name of a
+            built-in preset (e.g., 'private-dir') or a PermissionsMode
+            instance. Integers are rejected, since an unquoted 644 reads as
+            octal digits to a person but as a decimal to a parser.
+        file_type (Literal['file', 'directory', 'any']): The type of paths the
+            entry applies to.
+    """
+
+    pattern: str
+    mode: int
+    file_type: Literal["file", "directory", "any"] = "any"
+
+    @field_validator("mode", mode="before")
+    @classmethod
+    def _validate_mode(cls, mode: Union[str, PermissionsMode]) -> int:
+        if not isinstance(mode, (str, PermissionsMode)):
+            raise ValueError(
+                "Mode must be a string octal representation (e.g., '644'), a "
+                f"preset name or a PermissionsMode, not {type(mode).__name__}"
+            )
+
+        if isinstance(mode, str) and mode in BUILTIN_PRESETS:
+            return BUILTIN_PRESETS[mode]
+
+        # Pydantic only reports ValueError and AssertionError as validation errors
+        try:
+            return to_decimal_mode(mode=mode)
+        except InvalidOctalError as error:
+            raise ValueError(str(error))
+
+    @property
+    def permissions(self) -> PermissionsMode:
+        """A PermissionsMode instance for the target mode."""
+        return PermissionsMode.from_octal_representation(octal=self.mode)
+
+
+class PermissionsManifest(BaseModel):
+    """
+    A declarative manifest of target Unix permissions modes for a tree. When
+    several entries match a path, the last one wins.
+
+    Target modes replace the read, write and execute bits only, so the
+    setuid, setgid and sticky bits of existing paths are preserved.
+
+    Args:
+        entries (List[ManifestEntry]): The entries of the manifest.
+    """
+
+    entries: List[ManifestEntry] = []
+
+    _compiled: Optional[Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]] = (
+        PrivateAttr(default=None)
+    )
+
+    @classmethod
+    def from_file(cls, path: str) -> PermissionsManifest:
+        """
+        Creates a PermissionsManifest instance from a JSON or YAML file. YAML
+        files ('.yaml' or '.yml') require PyYAML to be installed.
+
+        Modes must be quoted strings (e.g., 'mode: "644"'), as unquoted
+        numbers are rejected.
+
+        Args:
+            path (str): The path of the manifest file.
+
+        Returns:
+            PermissionsManifest: A new instance of PermissionsManifest.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            content = file.read()
+
+        data: Any
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml  # type: ignore[import-untyped]
+            except ImportError:
+                raise ImportError("PyYAML is required to load YAML manifests")
+
+            data = yaml.safe_load(content)
+        else:
+            data = json.loads(content)
+
+        return cls.model_validate(data)
+
+    def _compile(self) -> Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]:
+        """
+        Private method to compile all entries, once, into one regular
+        expression for files and one for directories. Entries are added in
+        reverse order, each in its own group, so the group that matches
+        identifies the last matching entry.
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        compiled: List[Optional[Pattern[str]]] = []
+        for file_types in [("file", "any"), ("directory", "any")]:
+            alternatives: List[str] = []
+            for index in reversed(range(len(self.entries))):
+                entry = self.entries[index]
+                if entry.file_type in file_types:
+                    alternatives.append(
+                        f"(?P<e{index}>{_translate_glob(entry.pattern)})"
+                    )
+
+            compiled.append(
+                re.compile("|".join(alternatives), re.DOTALL) if alternatives else None
+            )
+
+        self._compiled = (compiled[0], compiled[1])
+        return self._compiled
+
+    def match(self, path: str, is_directory: bool = False) -> Optional[ManifestEntry]:
+        """
+        Finds the entry that applies to a path.
+
+        Args:
+            path (str): A path relative to the root of the tree, using '/' as
+                separator.
+            is_directory (bool): A boolean indicating whether the path is a
+                directory.
+
+        Returns:
+            ManifestEntry | None: The last matching entry, or None.
+        """
+        file_pattern, directory_pattern = self._compile()
+        pattern = directory_pattern if is_directory else file_pattern
+        if pattern is None:
+            return None
+
+        matched = pattern.fullmatch(path)
+        if matched is None or matched.lastgroup is None:
+            return None
+
+        return self.entries[int(matched.lastgroup[1:])]
+
+    def plan(self, root: str) -> ConvergencePlan:
+        """
+        Walks a tree once and computes the changes needed to converge it to
+        the manifest. Symbolic links are skipped.
+
+        Args:
+            root (str): The root directory of the tree.
+
+        Returns:
+            ConvergencePlan: A named tuple containing the root, the list of
+                PlannedChange tuples, the number of entries examined and the
+                elapsed time in seconds.
+        """
+        started = time.perf_counter()
+        root = os.path.abspath(root)
+        changes: List[PlannedChange] = []
+        entries_examined = 0
+
+        stack: List[Tuple[str, str]] = [(root, "")]
+        while stack:
+            directory, relative_directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_symlink():
+                            continue
+
+                        entries_examined += 1
+                        relative_path = f"{relative_directory}{entry.name}"
+                        is_directory = entry.is_dir(follow_symlinks=False)
+                        if is_directory:
+                            stack.append((entry.path, f"{relative_path}/"))
+
+                        manifest_entry = self.match(
+                            path=relative_path, is_directory=is_directory
+                        )
+                        if manifest_entry is None:
+                            continue
+
+                        current_mode = stat.S_IMODE(
+                            entry.stat(follow_symlinks=False).st_mode
+                        )
+                        target_mode = (current_mode & ~0o777) | manifest_entry.mode
+                        if current_mode != target_mode:
+                            changes.append(
+                                PlannedChange(
+                                    path=entry.path,
+                                    current_mode=current_mode,
+                                    target_mode=target_mode,
+                                )
+                            )
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+
+        return ConvergencePlan(
+            root=root,
+            changes=changes,
+            entries_examined=entries_examined,
+            elapsed=time.perf_counter() - started,
+        )
+
+
+def execute_plan(plan: ConvergencePlan) -> ConvergenceSummary:
+    """
+    Executes a convergence plan, issuing one chmod per planned change.
+    Failures are collected rather than raised.
+
+    Args:
+        plan (ConvergencePlan): A plan from PermissionsManifest.plan.
+
+    Returns:
+        ConvergenceSummary: A named tuple containing the number of changed
+            and failed paths, a list of (path, error) tuples and the elapsed
+            time in seconds.
+    """
+    started = time.perf_counter()
+    changed = 0
+    errors: List[Tuple[str, str]] = []
+
+    for change in plan.changes:
+        try:
+            os.chmod(change.path, change.target_mode)
+        except OSError as error:
+            errors.append((change.path, error.strerror or str(error)))
+        else:
+            changed += 1
+
+    return ConvergenceSummary(
+        changed=changed,
+        failed=len(errors),
+        errors=errors,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def converge(
+    manifest: PermissionsManifest, root: str, dry_run: bool = False
+) -> Tuple[ConvergencePlan, Optional[ConvergenceSummary]]:
+    """
+    Plans and, unless 'dry_run' is set, executes the convergence of a tree
+    to a manifest.
+
+    Args:
+        manifest (PermissionsManifest): The manifest to converge to.
+        root (str): The root directory of the tree.
+        dry_run (bool): A boolean indicating whether only the plan should be
+            computed.
+
+    Returns:
+        Tuple[ConvergencePlan, ConvergenceSummary | None]: The plan and the
+            execution summary, which is None for a dry run.
+    """
+    plan = manifest.plan(root=root)
+    if dry_run:
+        return plan, None
+
+    return plan, execute_plan(plan=plan)
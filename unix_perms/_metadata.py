@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import os
+import stat
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from unix_perms._types import PermissionsMode
+
+try:
+    import grp
+    import pwd
+except ImportError:  # pragma: no cover - not available on Windows
+    grp = None  # type: ignore[assignment]
+    pwd = None  # type: ignore[assignment]
+
+FILE_TYPES: Dict[int, str] = {
+    stat.S_IFREG: "file",
+    stat.S_IFDIR: "directory",
+    stat.S_IFLNK: "symlink",
+    stat.S_IFCHR: "character-device",
+    stat.S_IFBLK: "block-device",
+    stat.S_IFIFO: "fifo",
+    stat.S_IFSOCK: "socket",
+}
+
+
+def file_type_from_mode(st_mode: int) -> str:
+    """
+    Determines the file type from the 'st_mode' of a stat result.
+
+    Args:
+        st_mode (int): The 'st_mode' of a stat result, including file type bits.
+
+    Returns:
+        str: One of the file types ('file', 'directory', 'symlink',
+            'character-device', 'block-device', 'fifo', 'socket'), or 'unknown'.
+    """
+    return FILE_TYPES.get(stat.S_IFMT(st_mode), "unknown")
+
+
+class FileMetadata:
+    """
+    A compact record pairing the permissions mode of a file with its owner,
+    group and file type.
+
+    Args:
+        path (str): The path of the file.
+        mode (int): The permission bits of the file, including the setuid,
+            setgid and sticky bits.
+        uid (int): The user id of the owner.
+        gid (int): The group id of the group.
+        file_type (str): The type of the file (e.g., 'file', 'directory').
+    """
+
+    __slots__ = ("path", "mode", "uid", "gid", "file_type")
+
+    def __init__(self, path: str, mode: int, uid: int, gid: int, file_type: str):
+        self.path = path
+        self.mode = mode
+        self.uid = uid
+        self.gid = gid
+        self.file_type = file_type
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileMetadata):
+            return NotImplemented
+
+        return (self.path, self.mode, self.uid, self.gid, self.file_type) == (
+            other.path,
+            other.mode,
+            other.uid,
+            other.gid,
+            other.file_type,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} path={self.path} "
+            f"permissions_mode={self.permissions_mode} uid={self.uid} "
+            f"gid={self.gid} file_type={self.file_type}>"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    @classmethod
+    def from_stat(cls, path: str, stat_result: os.stat_result) -> FileMetadata:
+        """
+        Creates a FileMetadata instance from a stat result.
+
+        Args:
+            path (str): The path of the file.
+            stat_result (os.stat_result): The stat result of the file.
+
+        Returns:
+            FileMetadata: A new instance of FileMetadata for the file.
+        """
+        st_mode: int = stat_result.st_mode
+        return cls(
+            path=path,
+            mode=stat.S_IMODE(st_mode),
+            uid=stat_result.st_uid,
+            gid=stat_result.st_gid,
+            file_type=file_type_from_mode(st_mode=st_mode),
+        )
+
+    @classmethod
+    def from_path(cls, path: str, follow_symlinks: bool = False) -> FileMetadata:
+        """
+        Creates a FileMetadata instance by calling stat on a path.
+
+        Args:
+            path (str): The path of the file.
+            follow_symlinks (bool): A boolean indicating whether symbolic
+                links should be followed.
+
+        Returns:
+            FileMetadata: A new instance of FileMetadata for the file.
+        """
+        stat_result = os.stat(path, follow_symlinks=follow_symlinks)
+        return cls.from_stat(path=path, stat_result=stat_result)
+
+    @property
+    def permissions_mode(self) -> str:
+        """The Unix permissions mode."""
+        return format(self.mode & 0o777, "o").zfill(3)
+
+    @property
+    def permissions(self) -> PermissionsMode:
+        """A PermissionsMode instance for the Unix permissions mode."""
+        return PermissionsMode.from_octal_representation(octal=self.mode & 0o777)
+
+    @property
+    def is_setuid(self) -> bool:
+        """A boolean indicating whether the setuid bit is set."""
+        return bool(self.mode & stat.S_ISUID)
+
+    @property
+    def is_setgid(self) -> bool:
+        """A boolean indicating whether the setgid bit is set."""
+        return bool(self.mode & stat.S_ISGID)
+
+    @property
+    def is_sticky(self) -> bool:
+        """A boolean indicating whether the sticky bit is set."""
+        return bool(self.mode & stat.S_ISVTX)
+
+
+def _parse_database(path: str) -> Dict[int, str]:
+    """
+    Private function to parse a colon-separated account database, such as
+    '/etc/passwd' or '/etc/group', into a mapping of id to name.
+    """
+    names: Dict[int, str] = dict()
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            for line in file:
+                if not line.strip() or line.startswith(("#", "+", "-")):
+                    continue
+
+                fields = line.split(":")
+                if len(fields) < 3:
+                    continue
+
+                try:
+                    identifier = int(fields[2])
+                except ValueError:
+                    continue
+
+                # The first entry wins, matching the behavior of getpwuid
+                names.setdefault(identifier, fields[0])
+    except OSError:
+        pass
+
+    return names
+
+
+class _LRUCache:
+    """
+    Private bounded mapping of id to name with least recently used eviction.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, Optional[str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> Tuple[bool, Optional[str]]:
+        if key not in self._entries:
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, self._entries[key]
+
+    def put(self, key: int, value: Optional[str]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class OwnerResolver:
+    """
+    Resolves user and group ids to names, caching the results.
+
+    The local '/etc/passwd' and '/etc/group' databases are loaded once in
+    bulk. Ids not found there (e.g., from LDAP or other name services) fall
+    back to 'pwd' and 'grp' lookups, whose results, including misses, are
+    kept in bounded LRU caches.
+
+    Args:
+        maxsize (int): The maximum number of fallback lookups cached for
+            each of users and groups.
+        passwd_file (str): The path of the user database to preload.
+        group_file (str): The path of the group database to preload.
+
+    Raises:
+        ValueError: If 'maxsize' is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        passwd_file: str = "/etc/passwd",
+        group_file: str = "/etc/group",
+    ):
+        if maxsize < 1:
+            raise ValueError("Maximum cache size must be a positive integer")
+
+        self._user_names: Dict[int, str] = _parse_database(path=passwd_file)
+        self._group_names: Dict[int, str] = _parse_database(path=group_file)
+        self._user_cache = _LRUCache(maxsize=maxsize)
+        self._group_cache = _LRUCache(maxsize=maxsize)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} users={len(self._user_names)} "
+            f"groups={len(self._group_names)}>"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def user_name(self, uid: int) -> Optional[str]:
+        """
+        Resolves a user id to a user name.
+
+        Args:
+            uid (int): The user id.
+
+        Returns:
+            str | None: The user name, or None if the id cannot be resolved.
+        """
+        name = self._user_names.get(uid)
+        if name is not None:
+            return name
+
+        found, name = self._user_cache.get(uid)
+        if found:
+            return name
+
+        if pwd is not None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except (KeyError, OverflowError):
+                name = None
+
+        self._user_cache.put(uid, name)
+        return name
+
+    def group_name(self, gid: int) -> Optional[str]:
+        """
+        Resolves a group id to a group name.
+
+        Args:
+            gid (int): The group id.
+
+        Returns:
+            str | None: The group name, or None if the id cannot be resolved.
+        """
+        name = self._group_names.get(gid)
+        if name is not None:
+            return name
+
+        found, name = self._group_cache.get(gid)
+        if found:
+            return name
+
+        if grp is not None:
+            try:
+                name = grp.getgrgid(gid).gr_name
+            except (KeyError, OverflowError):
+                name = None
+
+        self._group_cache.put(gid, name)
+        return name
+
+    def resolve(self, metadata: FileMetadata) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolves the owner and group names of a FileMetadata record.
+
+        Args:
+            metadata (FileMetadata): The record to resolve.
+
+        Returns:
+            Tuple[str | None, str | None]: The owner and group names.
+        """
+        return self.user_name(uid=metadata.uid), self.group_name(gid=metadata.gid)
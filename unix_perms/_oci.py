@@ -0,0 +1,257 @@
+import json
+import os
+import posixpath
+import tarfile
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from unix_perms._archives import (
+    ArchivePolicy,
+    default_archive_policy,
+    tar_member_metadata,
+)
+from unix_perms._metadata import FileMetadata
+
+ImageReport = namedtuple(
+    "ImageReport", ["layers", "entries", "distribution", "violations"]
+)
+
+WHITEOUT_PREFIX = ".wh."
+OPAQUE_WHITEOUT = ".wh..wh..opq"
+
+_INDEX_MEDIA_TYPES = {
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+}
+
+
+class _LayerChanges:
+    """
+    Private structure holding the changes made by a single image layer.
+    """
+
+    __slots__ = ("entries", "whiteouts", "opaque_directories")
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, FileMetadata] = dict()
+        self.whiteouts: List[str] = []
+        self.opaque_directories: List[str] = []
+
+
+def _normalize_path(name: str) -> str:
+    """
+    Private function to normalize the name of a layer member to a path
+    relative to the image root, returning an empty string for the root.
+    """
+    return posixpath.normpath("/" + name).lstrip("/")
+
+
+def _blob_path(layout: str, digest: str) -> str:
+    """
+    Private function to retrieve the path of a blob in an OCI image layout
+    from its digest.
+    """
+    algorithm, _, encoded = digest.partition(":")
+    if not algorithm or not encoded or "/" in encoded:
+        raise ValueError(f"Invalid digest '{digest}'")
+
+    return os.path.join(layout, "blobs", algorithm, encoded)
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    """
+    Private function to load a JSON document.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        document: Dict[str, Any] = json.load(file)
+    return document
+
+
+def _resolve_manifest(layout: str, manifest_digest: Optional[str]) -> Dict[str, Any]:
+    """
+    Private function to resolve the image manifest to scan, descending into
+    nested image indexes when no digest is given.
+    """
+    if manifest_digest is not None:
+        return _load_json(_blob_path(layout=layout, digest=manifest_digest))
+
+    index = _load_json(os.path.join(layout, "index.json"))
+    while True:
+        manifests: List[Dict[str, Any]] = index.get("manifests", [])
+        if not manifests:
+            raise ValueError("OCI image index does not contain any manifests")
+
+        descriptor = manifests[0]
+        document = _load_json(_blob_path(layout=layout, digest=descriptor["digest"]))
+        if descriptor.get("mediaType") in _INDEX_MEDIA_TYPES or "manifests" in document:
+            index = document
+            continue
+
+        return document
+
+
+def _read_layer(path: str, media_type: str) -> _LayerChanges:
+    """
+    Private function to stream a layer tarball and collect its entries and
+    whiteouts without extracting anything to disk.
+    """
+    if "zstd" in media_type:
+        raise ValueError("zstd-compressed layers are not supported")
+
+    changes = _LayerChanges()
+    with open(path, "rb") as file, tarfile.open(fileobj=file, mode="r|*") as layer:
+        for member in layer:
+            path_in_image = _normalize_path(name=member.name)
+            if not path_in_image:
+                continue
+
+            directory, name = posixpath.split(path_in_image)
+            if name == OPAQUE_WHITEOUT:
+                changes.opaque_directories.append(directory)
+            elif name.startswith(WHITEOUT_PREFIX):
+                changes.whiteouts.append(
+                    posixpath.join(directory, name[len(WHITEOUT_PREFIX) :])
+                )
+            else:
+                metadata = tar_member_metadata(member=member)
+                metadata.path = path_in_image
+                changes.entries[path_in_image] = metadata
+
+    return changes
+
+
+class _ImageTree:
+    """
+    Private structure holding the effective entries of an image as layers
+    are applied in order.
+    """
+
+    __slots__ = ("entries", "children")
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, FileMetadata] = dict()
+        self.children: Dict[str, Set[str]] = dict()
+
+    def _remove_children(self, path: str) -> None:
+        """
+        Private method to remove every entry below a directory.
+        """
+        stack: List[str] = list(self.children.pop(path, ()))
+        while stack:
+            child = stack.pop()
+            self.entries.pop(child, None)
+            stack.extend(self.children.pop(child, ()))
+
+    def remove(self, path: str) -> None:
+        """
+        Private method to remove an entry and every entry below it.
+        """
+        self._remove_children(path=path)
+        if self.entries.pop(path, None) is not None:
+            self.children.get(posixpath.dirname(path), set()).discard(path)
+
+    def add(self, metadata: FileMetadata) -> None:
+        """
+        Private method to add or replace an entry. Replacing a directory with
+        a non-directory removes every entry below it.
+        """
+        path = metadata.path
+        previous = self.entries.get(path)
+        if previous is not None and metadata.file_type != "directory":
+            self._remove_children(path=path)
+
+        self.entries[path] = metadata
+        self.children.setdefault(posixpath.dirname(path), set()).add(path)
+
+    def apply(self, changes: _LayerChanges) -> None:
+        """
+        Private method to apply the changes of a layer on top of the entries
+        of the layers below it.
+        """
+        # Whiteouts only hide entries from lower layers, so they are applied
+        # before the entries of the same layer
+        for directory in changes.opaque_directories:
+            self._remove_children(path=directory)
+
+        for path in changes.whiteouts:
+            self.remove(path=path)
+
+        for metadata in changes.entries.values():
+            self.add(metadata=metadata)
+
+
+def scan_oci_image(
+    layout: str,
+    manifest_digest: Optional[str] = None,
+    policy: Optional[ArchivePolicy] = default_archive_policy,
+    max_workers: Optional[int] = None,
+) -> ImageReport:
+    """
+    Scans a local OCI image layout directory, reporting the effective mode of
+    every path after all layers are applied.
+
+    Layer tarballs are streamed in parallel without extracting anything to
+    disk, and their changes are merged in layer order with overlay semantics:
+    whiteout files ('.wh.<name>') remove paths from lower layers and opaque
+    whiteouts ('.wh..wh..opq') hide the lower contents of a directory.
+
+    Args:
+        layout (str): The path of the OCI image layout directory.
+        manifest_digest (str | None): The digest of the image manifest to
+            scan. If None, the first manifest in 'index.json' is used,
+            descending into nested image indexes.
+        policy (Callable[[FileMetadata], str | None] | None): A callable that
+            returns a description of the violation for an entry, or None. If
+            None, no policy is applied.
+        max_workers (int | None): The maximum number of layers read in
+            parallel.
+
+    Returns:
+        ImageReport: A named tuple containing the number of layers, the
+            effective FileMetadata of every path keyed by path, the number of
+            entries for each Unix permissions mode, and a list of (path,
+            violation) tuples.
+
+    Raises:
+        ValueError: If the layout has no manifests or uses an unsupported
+            layer compression.
+    """
+    manifest = _resolve_manifest(layout=layout, manifest_digest=manifest_digest)
+    layers: List[Tuple[str, str]] = [
+        (
+            _blob_path(layout=layout, digest=descriptor["digest"]),
+            descriptor.get("mediaType", ""),
+        )
+        for descriptor in manifest.get("layers", [])
+    ]
+
+    tree = _ImageTree()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_read_layer, path, media_type)
+            for path, media_type in layers
+        ]
+        for future in futures:
+            tree.apply(changes=future.result())
+
+    entries: Dict[str, FileMetadata] = dict(sorted(tree.entries.items()))
+    distribution: Counter[str] = Counter(
+        metadata.permissions_mode
+        for metadata in entries.values()
+        if metadata.file_type != "symlink"
+    )
+
+    violations: List[Tuple[str, str]] = []
+    if policy is not None:
+        for path, metadata in entries.items():
+            violation: Optional[str] = policy(metadata)
+            if violation is not None:
+                violations.append((path, violation))
+
+    return ImageReport(
+        layers=len(layers),
+        entries=entries,
+        distribution=dict(sorted(distribution.items())),
+        violations=violations,
+    )
@@ -152,7 +152,12 @@ def from_octal_to_permissions_mode(octal: Union[str, int]) -> str:
         except ValueError:
             raise InvalidOctalError(message)
         else:
-            octal_as_str = str(octal_as_int)
+            # Octal literals are parsed as their decimal value, so they must be
+            # formatted back to octal digits before validation
+            if int_base == 8:
+                octal_as_str = format(octal_as_int, "o")
+            else:
+                octal_as_str = str(octal_as_int)
             permissions_mode = _octal_validation(octal=octal_as_str)
             return permissions_mode
     else:
@@ -1,41 +1,68 @@
-import stat
-from typing import Literal
-
-from unix_perms._models import Authority
-
-OWNER_PERMISSIONS = Authority(
-    read_write_execute=stat.S_IRWXU,
-    read_write=stat.S_IRUSR | stat.S_IWUSR,
-    read=stat.S_IRUSR,
-    read_execute=stat.S_IRUSR | stat.S_IXUSR,
-    write_execute=stat.S_IWUSR | stat.S_IXUSR,
-    write=stat.S_IWUSR,
-    execute=stat.S_IXUSR,
-)
-GROUP_PERMISSIONS = Authority(
-    read_write_execute=stat.S_IRWXG,
-    read_write=stat.S_IRGRP | stat.S_IWGRP,
-    read=stat.S_IRGRP,
-    read_execute=stat.S_IRGRP | stat.S_IXGRP,
-    write_execute=stat.S_IWGRP | stat.S_IXGRP,
-    write=stat.S_IWGRP,
-    execute=stat.S_IXGRP,
-)
-OTHERS_PERMISSIONS = Authority(
-    read_write_execute=stat.S_IRWXO,
-    read_write=stat.S_IROTH | stat.S_IWOTH,
-    read=stat.S_IROTH,
-    read_execute=stat.S_IROTH | stat.S_IXOTH,
-    write_execute=stat.S_IWOTH | stat.S_IXOTH,
-    write=stat.S_IWOTH,
-    execute=stat.S_IXOTH,
-)
+from typing import Dict, Literal, Tuple
+
+# Bit values for read, write, and execute within a single octal digit
+READ_BIT = 0o4
+WRITE_BIT = 0o2
+EXECUTE_BIT = 0o1
 
-PERMISSIONS_MAPPING = {
-    "owner": OWNER_PERMISSIONS,
-    "group": GROUP_PERMISSIONS,
-    "others": OTHERS_PERMISSIONS,
+AUTHORITY_INDEX: Dict[str, int] = {
+    "owner": 0,
+    "group": 1,
+    "others": 2,
 }
+AUTHORITY_SHIFTS: Tuple[int, int, int] = (6, 3, 0)
+
+# Static mask table indexed by (authority index, rwx bits), where each entry
+# is the rwx bits shifted into the position of that authority within a mode
+PERMISSIONS_MASKS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(bits << shift for bits in range(8)) for shift in AUTHORITY_SHIFTS
+)
+
+
+def get_authority_index(authority: str) -> int:
+    """
+    Validates an authority and returns its index within the static mask table.
+
+    Args:
+        authority (str): A specific permissions authority.
+
+    Returns:
+        int: The index of the authority within the static mask table.
+
+    Raises:
+        ValueError: If 'authority' is not one of ('owner', 'group', 'others').
+    """
+    if authority not in AUTHORITY_INDEX:
+        raise ValueError("Authority should be one of ('owner', 'group', 'others')")
+    return AUTHORITY_INDEX[authority]
+
+
+def get_permissions_mask(
+    authority: Literal["owner", "group", "others"],
+    read: bool,
+    write: bool,
+    execute: bool,
+) -> int:
+    """
+    Retrieves the decimal representation of the permissions for a specific
+    authority from the static mask table.
+
+    Args:
+        authority (Literal['owner', 'group', 'others']): A specific permissions
+            authority.
+        read (bool): A boolean indicating whether read permission is included.
+        write (bool): A boolean indicating whether write permission is included.
+        execute (bool): A boolean indicating whether execute permission is included.
+
+    Returns:
+        int: The decimal representation of the permissions for the authority.
+
+    Raises:
+        ValueError: If 'authority' is not one of ('owner', 'group', 'others').
+    """
+    authority_index: int = get_authority_index(authority=authority)
+    bits: int = (read << 2) | (write << 1) | execute
+    return PERMISSIONS_MASKS[authority_index][bits]
 
 
 class OctalPermissions:
@@ -45,7 +72,7 @@ class OctalPermissions:
     ('owner', 'group', 'others').
 
     This class validates the given authority and assigns the corresponding
-    permissions mapping.
+    row of the static mask table.
 
     Args:
         authority (Literal['owner', 'group', 'others']): A specific permissions authority.
@@ -56,11 +83,9 @@ class OctalPermissions:
 
     def __init__(self, authority: Literal["owner", "group", "others"]):
         self.authority = authority
-
-        if authority not in {"owner", "group", "others"}:
-            raise ValueError("Authority should be one of ('owner', 'group', 'others')")
-
-        self._permissions: Authority = PERMISSIONS_MAPPING[authority]
+        self._masks: Tuple[int, ...] = PERMISSIONS_MASKS[
+            get_authority_index(authority=authority)
+        ]
 
     @property
     def no_permissions(self) -> int:
@@ -68,28 +93,36 @@ class OctalPermissions:
 
     @property
     def read_write_execute(self) -> int:
-        return self._permissions.read_write_execute
+        return self._masks[READ_BIT | WRITE_BIT | EXECUTE_BIT]
 
     @property
     def read_write(self) -> int:
-        return self._permissions.read_write
+        return self._masks[READ_BIT | WRITE_BIT]
 
     @property
     def read(self) -> int:
-        return self._permissions.read
+        return self._masks[READ_BIT]
 
     @property
     def read_execute(self) -> int:
-        return self._permissions.read_execute
+        return self._masks[READ_BIT | EXECUTE_BIT]
 
     @property
     def write_execute(self) -> int:
-        return self._permissions.write_execute
+        return self._masks[WRITE_BIT | EXECUTE_BIT]
 
     @property
     def write(self) -> int:
-        return self._permissions.write
+        return self._masks[WRITE_BIT]
 
     @property
     def execute(self) -> int:
-        return self._permissions.execute
+        return self._masks[EXECUTE_BIT]
+
+
+# Shared instances so that byte objects need not build their own helper
+OCTAL_PERMISSIONS: Dict[str, OctalPermissions] = {
+    "owner": OctalPermissions(authority="owner"),
+    "group": OctalPermissions(authority="group"),
+    "others": OctalPermissions(authority="others"),
+}
@@ -0,0 +1,202 @@
+from collections import namedtuple
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from unix_perms._types import PermissionsMode, to_decimal_mode
+
+PresetMatch = namedtuple("PresetMatch", ["names", "distance"])
+
+# Total number of distinct Unix permissions modes (0o000 to 0o777)
+_NUMBER_OF_MODES = 0o777 + 1
+
+BUILTIN_PRESETS: Dict[str, int] = {
+    "private-dir": 0o700,
+    "private-file": 0o600,
+    "shared-group-dir": 0o770,
+    "shared-group-rw": 0o660,
+    "public-dir": 0o755,
+    "public-file": 0o644,
+    "public-readonly": 0o444,
+    "executable": 0o755,
+}
+
+
+class PermissionsPresets:
+    """
+    A registry of named Unix permissions modes, including built-in presets
+    and any user-defined presets.
+
+    A reverse index from mode to preset names and a table of the closest
+    presets, by Hamming distance, for every possible mode are precomputed
+    whenever the registry changes, so lookups and classification are O(1).
+
+    Args:
+        presets (Mapping[str, PermissionsMode | str | int] | None): Additional
+            presets to register, keyed by name.
+        include_builtins (bool): A boolean indicating whether the built-in
+            presets should be registered.
+    """
+
+    def __init__(
+        self,
+        presets: Optional[Mapping[str, Union[PermissionsMode, str, int]]] = None,
+        include_builtins: bool = True,
+    ):
+        self._presets: Dict[str, int] = dict()
+        self._names_by_mode: Dict[int, Tuple[str, ...]] = dict()
+        self._closest: List[PresetMatch] = []
+
+        if include_builtins:
+            self._presets.update(BUILTIN_PRESETS)
+
+        if presets is not None:
+            for name, mode in presets.items():
+                self._add(name=name, mode=mode, overwrite=True)
+
+        self._rebuild()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._presets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._presets)
+
+    def __len__(self) -> int:
+        return len(self._presets)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} presets={len(self._presets)}>"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def _add(
+        self, name: str, mode: Union[PermissionsMode, str, int], overwrite: bool
+    ) -> None:
+        """
+        Private method to validate and add a preset without rebuilding the
+        precomputed indexes.
+        """
+        if not isinstance(name, str) or not name:
+            raise ValueError("Preset name must be a non-empty string")
+
+        if name in self._presets and not overwrite:
+            raise ValueError(f"Preset '{name}' is already registered")
+
+        self._presets[name] = to_decimal_mode(mode=mode)
+
+    def _rebuild(self) -> None:
+        """
+        Private method to recompute the reverse index from mode to preset
+        names and the closest presets for every possible mode.
+        """
+        names_by_mode: Dict[int, List[str]] = dict()
+        for name, mode in self._presets.items():
+            names_by_mode.setdefault(mode, []).append(name)
+
+        self._names_by_mode = {
+            mode: tuple(names) for mode, names in names_by_mode.items()
+        }
+
+        closest: List[PresetMatch] = []
+        for mode in range(_NUMBER_OF_MODES):
+            best_distance: Optional[int] = None
+            best_names: Tuple[str, ...] = tuple()
+
+            for preset_mode, names in self._names_by_mode.items():
+                distance: int = bin(mode ^ preset_mode).count("1")
+                if best_distance is None or distance < best_distance:
+                    best_distance = distance
+                    best_names = names
+                elif distance == best_distance:
+                    best_names += names
+
+            closest.append(PresetMatch(names=best_names, distance=best_distance))
+
+        self._closest = closest
+
+    def register(
+        self,
+        name: str,
+        mode: Union[PermissionsMode, str, int],
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Registers a named preset.
+
+        Args:
+            name (str): The name of the preset.
+            mode (PermissionsMode | str | int): A PermissionsMode instance or
+                an octal representation as a string or integer.
+            overwrite (bool): A boolean indicating whether an existing preset
+                with the same name should be replaced.
+
+        Raises:
+            ValueError: If 'name' is empty or already registered and
+                'overwrite' is False.
+        """
+        self._add(name=name, mode=mode, overwrite=overwrite)
+        self._rebuild()
+
+    def unregister(self, name: str) -> None:
+        """
+        Removes a named preset.
+
+        Args:
+            name (str): The name of the preset.
+
+        Raises:
+            KeyError: If no preset is registered under 'name'.
+        """
+        if name not in self._presets:
+            raise KeyError(f"No preset registered under '{name}'")
+
+        del self._presets[name]
+        self._rebuild()
+
+    def get(self, name: str) -> PermissionsMode:
+        """
+        Retrieves a new PermissionsMode instance for a named preset.
+
+        Args:
+            name (str): The name of the preset.
+
+        Returns:
+            PermissionsMode: A new instance of PermissionsMode for the preset.
+
+        Raises:
+            KeyError: If no preset is registered under 'name'.
+        """
+        if name not in self._presets:
+            raise KeyError(f"No preset registered under '{name}'")
+
+        return PermissionsMode.from_octal_representation(octal=self._presets[name])
+
+    def names_for(self, mode: Union[PermissionsMode, str, int]) -> Tuple[str, ...]:
+        """
+        Retrieves the names of all presets that exactly match a mode.
+
+        Args:
+            mode (PermissionsMode | str | int): A PermissionsMode instance or
+                an octal representation as a string or integer.
+
+        Returns:
+            Tuple[str, ...]: The names of the matching presets, in order of
+                registration, or an empty tuple if there are none.
+        """
+        return self._names_by_mode.get(to_decimal_mode(mode=mode), tuple())
+
+    def classify(self, mode: Union[PermissionsMode, str, int]) -> PresetMatch:
+        """
+        Classifies a mode into its closest presets by Hamming distance over
+        the permission bits.
+
+        Args:
+            mode (PermissionsMode | str | int): A PermissionsMode instance or
+                an octal representation as a string or integer.
+
+        Returns:
+            PresetMatch: A named tuple containing the names of the closest
+                presets and their distance, in bits, from the mode. If the
+                registry is empty, names is empty and distance is None.
+        """
+        return self._closest[to_decimal_mode(mode=mode)]
@@ -0,0 +1,191 @@
+import functools
+import importlib
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Instrumented functions as (module, attribute, class attribute) triples,
+# where the class attribute is only set for methods
+PROFILED_FUNCTIONS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ("unix_perms._octals", "from_octal_digit_to_config", None),
+    ("unix_perms._octals", "from_octal_to_permissions_mode", None),
+    ("unix_perms._octals", "is_permissions_mode", None),
+    ("unix_perms._types", "PermissionsConfig", "from_octal_digit"),
+    ("unix_perms._types", "PermissionsMode", "from_octal_representation"),
+    ("unix_perms._types", "PermissionsMode", "_generate_class_arguments_from_mode"),
+    (
+        "unix_perms._types",
+        "PermissionsMode",
+        "_generate_class_arguments_from_decimal",
+    ),
+)
+
+
+class FunctionStats:
+    """
+    Counters for a single instrumented function.
+
+    Args:
+        name (str): The qualified name of the function.
+    """
+
+    __slots__ = ("name", "calls", "errors", "total_time")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} name={self.name} calls={self.calls} "
+            f"errors={self.errors} total_time={self.total_time:.6f}>"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+_STATS: Dict[str, FunctionStats] = dict()
+
+# Restores for every patched reference, as (owner, attribute, original value)
+_PATCHES: List[Tuple[Any, str, Any]] = []
+
+
+def _instrument(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Private function to wrap a function so that calls, errors and cumulative
+    time are recorded.
+    """
+    stats = _STATS.setdefault(name, FunctionStats(name=name))
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            stats.errors += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.total_time += perf_counter() - started
+
+    return wrapper
+
+
+def is_profiling_enabled() -> bool:
+    """
+    A boolean function which determines if profiling is enabled.
+
+    Returns:
+        bool: A boolean indicating whether profiling is enabled.
+    """
+    return bool(_PATCHES)
+
+
+def enable_profiling() -> None:
+    """
+    Enables per-call profiling of the internals of unix_perms.
+
+    The instrumented functions are swapped in place for wrappers that count
+    calls, errors and cumulative time, so there is no overhead at all while
+    profiling is disabled. References to the functions bound outside of
+    unix_perms before profiling was enabled (e.g., through 'from unix_perms
+    import ...') keep calling the original functions.
+    """
+    if is_profiling_enabled():
+        return
+
+    modules = [
+        module
+        for name, module in list(sys.modules.items())
+        if name == "unix_perms" or name.startswith("unix_perms.")
+    ]
+
+    for module_name, attribute, class_attribute in PROFILED_FUNCTIONS:
+        owner = getattr(importlib.import_module(module_name), attribute)
+
+        if class_attribute is not None:
+            descriptor = owner.__dict__[class_attribute]
+            name = f"{attribute}.{class_attribute}"
+            wrapper = _instrument(name=name, function=descriptor.__func__)
+            _PATCHES.append((owner, class_attribute, descriptor))
+            setattr(owner, class_attribute, type(descriptor)(wrapper))
+            continue
+
+        # Module-level functions are patched wherever they were imported
+        wrapper = _instrument(name=attribute, function=owner)
+        for module in modules:
+            if getattr(module, attribute, None) is owner:
+                _PATCHES.append((module, attribute, owner))
+                setattr(module, attribute, wrapper)
+
+
+def disable_profiling() -> None:
+    """
+    Disables per-call profiling, restoring the original functions. Counters
+    are kept until 'reset_profiling' is called.
+    """
+    while _PATCHES:
+        owner, attribute, original = _PATCHES.pop()
+        setattr(owner, attribute, original)
+
+
+def reset_profiling() -> None:
+    """Resets the counters of all instrumented functions to zero."""
+    for stats in _STATS.values():
+        stats.calls = 0
+        stats.errors = 0
+        stats.total_time = 0.0
+
+
+def get_profiling_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Retrieves the counters of all instrumented functions that have been
+    called.
+
+    Returns:
+        Dict[str, Dict[str, float]]: A dictionary keyed by function name, each
+            value containing 'calls', 'errors' and 'total_time' in seconds.
+    """
+    return {
+        name: {
+            "calls": stats.calls,
+            "errors": stats.errors,
+            "total_time": stats.total_time,
+        }
+        for name, stats in sorted(_STATS.items())
+        if stats.calls
+    }
+
+
+def get_profiling_stats_prometheus(prefix: str = "unix_perms") -> str:
+    """
+    Exports the counters of all instrumented functions in the Prometheus
+    text exposition format.
+
+    Args:
+        prefix (str): The prefix for the metric names.
+
+    Returns:
+        str: The counters in the Prometheus text exposition format.
+    """
+    metrics = [
+        ("calls_total", "Number of calls to the function.", "calls"),
+        ("errors_total", "Number of calls that raised an exception.", "errors"),
+        ("seconds_total", "Cumulative time spent in the function.", "total_time"),
+    ]
+
+    stats = get_profiling_stats()
+    lines: List[str] = []
+    for suffix, description, key in metrics:
+        metric_name = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {metric_name} {description}")
+        lines.append(f"# TYPE {metric_name} counter")
+        for name, counters in stats.items():
+            lines.append(f'{metric_name}{{function="{name}"}} {counters[key]}')
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import importlib
+import os
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sized,
+    Tuple,
+    Type,
+)
+
+from unix_perms._metadata import FileMetadata
+
+SHARED_MAGIC = b"UNXPERMS"
+SHARED_VERSION = 1
+
+# File types are stored as one byte codes indexing this tuple
+SHARED_FILE_TYPES: Tuple[str, ...] = (
+    "unknown",
+    "file",
+    "directory",
+    "symlink",
+    "character-device",
+    "block-device",
+    "fifo",
+    "socket",
+)
+
+_FILE_TYPE_CODES: Dict[str, int] = {
+    file_type: code for code, file_type in enumerate(SHARED_FILE_TYPES)
+}
+
+# Header: magic, version, reserved, number of entries, size of the path data
+_HEADER = struct.Struct("<8sIIQQ")
+_NUMBER_OF_MODES = 0o777 + 1
+_UINT32_MASK = 0xFFFFFFFF
+
+Typecode = Literal["H", "I", "B", "Q"]
+
+# Typecode and item size of each array, in layout order
+_ARRAYS: Dict[str, Tuple[Typecode, int]] = {
+    "modes": ("H", 2),
+    "uids": ("I", 4),
+    "gids": ("I", 4),
+    "file_types": ("B", 1),
+    "path_offsets": ("Q", 8),
+    "distribution": ("Q", 8),
+}
+
+_NUMPY_DTYPES: Dict[str, str] = {"H": "<u2", "I": "<u4", "B": "u1", "Q": "<u8"}
+
+_ATTACH_LOCK = threading.Lock()
+
+
+def _align(offset: int) -> int:
+    """
+    Private function to align an offset to 8 bytes.
+    """
+    return (offset + 7) & ~7
+
+
+def _shared_buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """
+    Private function to retrieve the buffer of a block of shared memory.
+    """
+    buffer = shm.buf
+    if buffer is None:
+        raise ValueError(f"Shared memory '{shm.name}' is closed")
+    return buffer
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Private function to attach to an existing block of shared memory without
+    registering it with the resource tracker, which would otherwise unlink
+    the block when the attaching process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Before Python 3.13, attaching always registers POSIX blocks. Skipping
+    # the registration, rather than unregistering afterwards, leaves intact
+    # any registration of the creator when both share a resource tracker
+    register = resource_tracker.register
+    untracked_name = name.lstrip("/")
+
+    def register_others(name: Sized, rtype: str) -> None:
+        if rtype != "shared_memory" or str(name).lstrip("/") != untracked_name:
+            register(name, rtype)
+
+    with _ATTACH_LOCK:
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _layout(count: int) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """
+    Private function to compute the offset and length of every array and the
+    offset of the path data for a number of entries.
+    """
+    lengths: Dict[str, int] = {
+        "modes": count,
+        "uids": count,
+        "gids": count,
+        "file_types": count,
+        "path_offsets": count + 1,
+        "distribution": _NUMBER_OF_MODES,
+    }
+
+    offset = _HEADER.size
+    layout: Dict[str, Tuple[int, int]] = dict()
+    for name, (_, item_size) in _ARRAYS.items():
+        offset = _align(offset)
+        layout[name] = (offset, lengths[name])
+        offset += lengths[name] * item_size
+
+    return layout, offset
+
+
+class SharedMetadata:
+    """
+    Scan results stored in a block of shared memory as typed arrays, so that
+    other processes can query them without copying or deserializing.
+
+    The block holds an array of modes (uint16, including the setuid, setgid
+    and sticky bits), uids and gids (uint32), file type codes (uint8,
+    indexing SHARED_FILE_TYPES), path offsets (uint64) into the encoded
+    path data (see os.fsencode), and the number of entries for every mode
+    (uint64, indexed by the decimal representation of the mode, symbolic
+    links excluded).
+
+    Use 'create' to export entries and 'attach' to open an export from
+    another process. Views must be released, by dropping every reference,
+    before the instance is closed.
+
+    Args:
+        shm (shared_memory.SharedMemory): The block of shared memory.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        magic, version, _, count, paths_size = _HEADER.unpack_from(
+            _shared_buffer(shm=shm), 0
+        )
+        if magic != SHARED_MAGIC or version != SHARED_VERSION:
+            raise ValueError(f"Shared memory '{shm.name}' is not a unix_perms export")
+
+        self._shm = shm
+        self._count: int = count
+        self._layout, self._paths_offset = _layout(count=count)
+        self._paths_size: int = paths_size
+        self._views: Dict[str, memoryview] = dict()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name} entries={self._count}>"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __enter__(self) -> SharedMetadata:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @classmethod
+    def create(
+        cls, entries: Iterable[FileMetadata], name: Optional[str] = None
+    ) -> SharedMetadata:
+        """
+        Exports entries into a new block of shared memory. The creator is
+        responsible for calling 'unlink' once no process needs the block.
+
+        Args:
+            entries (Iterable[FileMetadata]): The entries to export.
+            name (str | None): The name of the block. If None, a unique name
+                is generated.
+
+        Returns:
+            SharedMetadata: A new instance of SharedMetadata owning the block.
+        """
+        records: List[FileMetadata] = list(entries)
+        encoded_paths: List[bytes] = [os.fsencode(record.path) for record in records]
+
+        count = len(records)
+        paths = b"".join(encoded_paths)
+        layout, paths_offset = _layout(count=count)
+
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=paths_offset + len(paths)
+        )
+        try:
+            cls._write(
+                shm=shm,
+                records=records,
+                encoded_paths=encoded_paths,
+                paths=paths,
+                layout=layout,
+                paths_offset=paths_offset,
+            )
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        return cls(shm=shm)
+
+    @staticmethod
+    def _write(
+        shm: shared_memory.SharedMemory,
+        records: List[FileMetadata],
+        encoded_paths: List[bytes],
+        paths: bytes,
+        layout: Dict[str, Tuple[int, int]],
+        paths_offset: int,
+    ) -> None:
+        """
+        Private method to write the header, arrays and path data of an export
+        into a new block of shared memory.
+        """
+        buffer = _shared_buffer(shm=shm)
+        count = len(records)
+        _HEADER.pack_into(buffer, 0, SHARED_MAGIC, SHARED_VERSION, 0, count, len(paths))
+        buffer[paths_offset : paths_offset + len(paths)] = paths
+
+        views: Dict[str, memoryview] = {
+            name: buffer[offset : offset + length * _ARRAYS[name][1]].cast(
+                _ARRAYS[name][0]
+            )
+            for name, (offset, length) in layout.items()
+        }
+
+        try:
+            modes = views["modes"]
+            uids = views["uids"]
+            gids = views["gids"]
+            file_types = views["file_types"]
+            path_offsets = views["path_offsets"]
+            distribution = views["distribution"]
+
+            path_offset = 0
+            for index, (record, path) in enumerate(zip(records, encoded_paths)):
+                modes[index] = record.mode & 0o7777
+                uids[index] = record.uid & _UINT32_MASK
+                gids[index] = record.gid & _UINT32_MASK
+                file_types[index] = _FILE_TYPE_CODES.get(record.file_type, 0)
+                if record.file_type != "symlink":
+                    distribution[record.mode & 0o777] += 1
+
+                path_offsets[index] = path_offset
+                path_offset += len(path)
+
+            path_offsets[count] = path_offset
+        finally:
+            for view in views.values():
+                view.release()
+
+    @classmethod
+    def attach(cls, name: str) -> SharedMetadata:
+        """
+        Opens an export created by another process. The block is not tracked
+        by the resource tracker of the attaching process, so a worker exiting
+        never destroys a block that other processes still use; only the
+        creator's 'unlink' does.
+
+        Args:
+            name (str): The name of the block of shared memory.
+
+        Returns:
+            SharedMetadata: A new instance of SharedMetadata.
+
+        Raises:
+            ValueError: If the block is not an export of unix_perms.
+        """
+        shm = _attach_untracked(name=name)
+        try:
+            return cls(shm=shm)
+        except ValueError:
+            shm.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        """The name of the block of shared memory."""
+        return self._shm.name
+
+    def _view(self, array_name: str) -> memoryview:
+        """
+        Private method to retrieve a typed memoryview of an array, created
+        once and cached until the instance is closed.
+        """
+        view = self._views.get(array_name)
+        if view is None:
+            offset, length = self._layout[array_name]
+            typecode, item_size = _ARRAYS[array_name]
+            buffer = _shared_buffer(shm=self._shm)
+            view = buffer[offset : offset + length * item_size].cast(typecode)
+            self._views[array_name] = view
+        return view
+
+    @property
+    def modes(self) -> memoryview:
+        """A uint16 memoryview of the modes of all entries."""
+        return self._view(array_name="modes")
+
+    @property
+    def uids(self) -> memoryview:
+        """A uint32 memoryview of the user ids of all entries."""
+        return self._view(array_name="uids")
+
+    @property
+    def gids(self) -> memoryview:
+        """A uint32 memoryview of the group ids of all entries."""
+        return self._view(array_name="gids")
+
+    @property
+    def file_types(self) -> memoryview:
+        """A uint8 memoryview of the file type codes of all entries."""
+        return self._view(array_name="file_types")
+
+    @property
+    def path_offsets(self) -> memoryview:
+        """A uint64 memoryview of the offsets of each path in the path data."""
+        return self._view(array_name="path_offsets")
+
+    @property
+    def distribution(self) -> memoryview:
+        """A uint64 memoryview of the number of entries for every mode."""
+        return self._view(array_name="distribution")
+
+    @property
+    def paths_data(self) -> memoryview:
+        """A memoryview of the encoded path data."""
+        view = self._views.get("paths")
+        if view is None:
+            start = self._paths_offset
+            buffer = _shared_buffer(shm=self._shm)
+            view = buffer[start : start + self._paths_size]
+            self._views["paths"] = view
+        return view
+
+    def path(self, index: int) -> str:
+        """
+        Decodes the path of an entry.
+
+        Args:
+            index (int): The index of the entry.
+
+        Returns:
+            str: The path of the entry.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("Entry index out of range")
+
+        path_offsets = self.path_offsets
+        start, end = path_offsets[index], path_offsets[index + 1]
+        return os.fsdecode(bytes(self.paths_data[start:end]))
+
+    def entry(self, index: int) -> FileMetadata:
+        """
+        Creates a FileMetadata record for an entry. Ids that were negative
+        when exported (e.g., -1 for zip members) are restored.
+
+        Args:
+            index (int): The index of the entry.
+
+        Returns:
+            FileMetadata: A new instance of FileMetadata for the entry.
+        """
+        uid: int = self.uids[index]
+        gid: int = self.gids[index]
+        return FileMetadata(
+            path=self.path(index=index),
+            mode=self.modes[index],
+            uid=-1 if uid == _UINT32_MASK else uid,
+            gid=-1 if gid == _UINT32_MASK else gid,
+            file_type=SHARED_FILE_TYPES[self.file_types[index]],
+        )
+
+    def __iter__(self) -> Iterator[FileMetadata]:
+        for index in range(self._count):
+            yield self.entry(index=index)
+
+    def as_numpy(self) -> Dict[str, Any]:
+        """
+        Wraps every array as a NumPy array sharing the block of shared memory.
+        Requires NumPy to be installed.
+
+        Returns:
+            Dict[str, numpy.ndarray]: The arrays keyed by name ('modes',
+                'uids', 'gids', 'file_types', 'path_offsets', 'distribution').
+        """
+        try:
+            numpy = importlib.import_module("numpy")
+        except ImportError:
+            raise ImportError("NumPy is required to create NumPy views")
+
+        return {
+            name: numpy.frombuffer(
+                _shared_buffer(shm=self._shm),
+                dtype=_NUMPY_DTYPES[typecode],
+                count=self._layout[name][1],
+                offset=self._layout[name][0],
+            )
+            for name, (typecode, _) in _ARRAYS.items()
+        }
+
+    def close(self) -> None:
+        """
+        Releases the cached views and closes access to the block of shared
+        memory from this instance.
+        """
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Requests the destruction of the block of shared memory. Should be
+        called once, by the creator, after every process has closed it.
+        """
+        self._shm.unlink()
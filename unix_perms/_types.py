@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Literal, Optional, Union
+from typing import Dict, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -9,7 +9,16 @@ from unix_perms._octals import (
     from_octal_digit_to_config,
     from_octal_to_permissions_mode,
 )
-from unix_perms._permissions import OctalPermissions
+from unix_perms._permissions import (
+    AUTHORITY_SHIFTS,
+    EXECUTE_BIT,
+    OCTAL_PERMISSIONS,
+    PERMISSIONS_MASKS,
+    READ_BIT,
+    WRITE_BIT,
+    OctalPermissions,
+    get_authority_index,
+)
 
 
 class PermissionsConfig(BaseModel):
@@ -68,8 +77,8 @@ class PermissionsByte:
         self.authority = authority
         self._config = PermissionsConfig() if config is None else config
 
-        # Set permissions for specific authority
-        self.permissions = OctalPermissions(authority=self.authority)
+        # Row of the static mask table for the specific authority
+        self._masks = PERMISSIONS_MASKS[get_authority_index(authority=authority)]
 
     def __add__(self, permission_byte: PermissionsByte) -> PermissionsMode:
         if not isinstance(permission_byte, PermissionsByte):
@@ -91,6 +100,11 @@ class PermissionsByte:
             f"permissions_mode={self.permissions_mode}>"
         )
 
+    @property
+    def permissions(self) -> OctalPermissions:
+        """The octal permissions for the specific authority."""
+        return OCTAL_PERMISSIONS[self.authority]
+
     @property
     def read_permission(self) -> bool:
         """A boolean indicating whether read permission is included."""
@@ -109,17 +123,7 @@ class PermissionsByte:
     @property
     def permissions_mode(self) -> str:
         """The Unix permissions mode."""
-        base_permissions = self.permissions.no_permissions
-        if self._config.read:
-            base_permissions |= self.permissions.read
-
-        if self._config.write:
-            base_permissions |= self.permissions.write
-
-        if self._config.execute:
-            base_permissions |= self.permissions.execute
-
-        return format(base_permissions, "o").zfill(3)
+        return format(self.permissions_mode_as_decimal_repr, "o").zfill(3)
 
     @property
     def permissions_description(self) -> str:
@@ -148,7 +152,8 @@ class PermissionsByte:
     @property
     def permissions_mode_as_decimal_repr(self) -> int:
         """The decimal representation of the Unix permissions mode"""
-        return int(self.permissions_mode, 8)
+        config = self._config
+        return self._masks[(config.read << 2) | (config.write << 1) | config.execute]
 
     @property
     def permissions_mode_as_int(self) -> int:
@@ -168,6 +173,17 @@ _OCTAL_MAPPING: Dict[int, Literal["owner", "group", "others"]] = {
 }
 _CLASS_PARAMETERS = list(_OCTAL_MAPPING.values())
 
+# One config per octal digit, built once without validation and shared by
+# every byte decoded from a mode, since bytes only ever read their config
+_CONFIGS_BY_DIGIT: Tuple[PermissionsConfig, ...] = tuple(
+    PermissionsConfig.model_construct(
+        read=bool(digit & READ_BIT),
+        write=bool(digit & WRITE_BIT),
+        execute=bool(digit & EXECUTE_BIT),
+    )
+    for digit in range(8)
+)
+
 
 class PermissionsMode:
     """
@@ -244,16 +260,31 @@ class PermissionsMode:
         the Unix permissions mode, and generate updated class arguments for
         a new PermissionsMode instance.
         """
-        permission_mode: str = from_octal_to_permissions_mode(
-            octal=permissions_mode_updated
-        )
+        # Combining two valid modes with AND or OR always yields a valid mode,
+        # so the decimal representation can be split directly
         class_arguments: Dict[str, PermissionsByte] = (
-            PermissionsMode._generate_class_arguments_from_mode(
-                permission_mode=permission_mode
+            PermissionsMode._generate_class_arguments_from_decimal(
+                permissions_mode=permissions_mode_updated
             )
         )
         return class_arguments
 
+    @staticmethod
+    def _generate_class_arguments_from_decimal(
+        permissions_mode: int,
+    ) -> Dict[str, PermissionsByte]:
+        """
+        Private static method to generate class arguments for a PermissionsMode
+        instance based on the decimal representation of a Unix permission mode.
+        """
+        return {
+            authority: PermissionsByte(
+                authority=authority,
+                config=_CONFIGS_BY_DIGIT[(permissions_mode >> shift) & 0o7],
+            )
+            for authority, shift in zip(_CLASS_PARAMETERS, AUTHORITY_SHIFTS)
+        }
+
     @staticmethod
     def _generate_class_arguments_from_mode(
         permission_mode: str,
@@ -262,20 +293,9 @@ class PermissionsMode:
         Private static method to generate class arguments for a PermissionsMode
         instance based on a Unix permission mode.
         """
-        class_arguments: Dict[str, PermissionsByte] = dict()
-
-        for index, octal_digit in enumerate(permission_mode):
-            permissions_authority = _OCTAL_MAPPING[index]
-            permissions_config = PermissionsConfig.from_octal_digit(
-                octal_digit=octal_digit
-            )
-
-            permissions_byte = PermissionsByte(
-                authority=permissions_authority, config=permissions_config
-            )
-            class_arguments.update({permissions_authority: permissions_byte})
-
-        return class_arguments
+        return PermissionsMode._generate_class_arguments_from_decimal(
+            permissions_mode=int(permission_mode, 8)
+        )
 
     @classmethod
     def _from_permissions_bytes(
@@ -324,29 +344,35 @@ class PermissionsMode:
             PermissionsMode: A new instance of PermissionsMode corresponding
                 to the provided octal value.
         """
-        permission_mode: str = from_octal_to_permissions_mode(octal=octal)
-        class_arguments: Dict[str, PermissionsByte] = (
-            PermissionsMode._generate_class_arguments_from_mode(
+        class_arguments: Dict[str, PermissionsByte]
+
+        # Integers within range are already the bits of the mode, so only
+        # strings and invalid values go through the parser
+        if type(octal) is int and 0 <= octal <= 0o777:
+            class_arguments = PermissionsMode._generate_class_arguments_from_decimal(
+                permissions_mode=octal
+            )
+        else:
+            permission_mode: str = from_octal_to_permissions_mode(octal=octal)
+            class_arguments = PermissionsMode._generate_class_arguments_from_mode(
                 permission_mode=permission_mode
             )
-        )
 
         return cls(**class_arguments)
 
     @property
     def permissions_mode(self) -> str:
         """REturns the Unix permissions mode."""
-        permissions_mode = (
-            self.owner.permissions_mode_as_decimal_repr
-            | self.group.permissions_mode_as_decimal_repr
-            | self.others.permissions_mode_as_decimal_repr
-        )
-        return format(permissions_mode, "o").zfill(3)
+        return format(self.permissions_mode_as_decimal_repr, "o").zfill(3)
 
     @property
     def permissions_mode_as_decimal_repr(self) -> int:
         """The decimal representation of the Unix permissions mode"""
-        return int(self.permissions_mode, 8)
+        return (
+            self.owner.permissions_mode_as_decimal_repr
+            | self.group.permissions_mode_as_decimal_repr
+            | self.others.permissions_mode_as_decimal_repr
+        )
 
     @property
     def permissions_mode_as_int(self) -> int:
@@ -360,3 +386,22 @@ class PermissionsMode:
         mode.
         """
         return f"0o{self.permissions_mode}"
+
+
+def to_decimal_mode(mode: Union[PermissionsMode, str, int]) -> int:
+    """
+    Converts a PermissionsMode instance or an octal representation to the
+    decimal representation of a Unix permissions mode.
+
+    Args:
+        mode (PermissionsMode | str | int): A PermissionsMode instance or an
+            octal representation as a string or integer.
+
+    Returns:
+        int: The decimal representation of the Unix permissions mode.
+    """
+    if isinstance(mode, PermissionsMode):
+        return mode.permissions_mode_as_decimal_repr
+
+    permissions_mode: str = from_octal_to_permissions_mode(octal=mode)
+    return int(permissions_mode, 8)